@@ -808,8 +808,8 @@ def list_policies(ctx, output_format):
                 click.echo(f"   Name: {policy['name']}")
                 click.echo(f"   Description: {policy['description']}")
                 click.echo(f"   Permission mode: {policy['permission_mode']}")
-                click.echo(f"   Allowed tools: {len(policy.get('allowed_tools', []))}")
-                click.echo(f"   Disallowed tools: {len(policy.get('disallowed_tools', []))}")
+                click.echo(f"   Allowed tools: {policy['allowed_tools_count']}")
+                click.echo(f"   Disallowed tools: {policy['disallowed_tools_count']}")
                 click.echo()
 
     except Exception as e:
@@ -858,8 +858,8 @@ def show_policy(ctx, policy_id, output_format):
 
             if 'file_access_rules' in policy:
                 click.echo("File access rules:")
-                for rule in policy['file_access_rules']:
-                    click.echo(f"  {rule}")
+                for key, value in policy['file_access_rules'].items():
+                    click.echo(f"  {key}: {value}")
                 click.echo()
 
     except Exception as e:
@@ -903,8 +903,11 @@ async def _list_policies_impl(
     """Implementation for list policies command."""
     await app.initialize()
 
-    # Get policies from policy enforcer
-    policies = await app.policy_enforcer.list_policies()
+    # Policy lookups are synchronous in-memory reads; nothing to await
+    policies = [
+        {'policy_id': policy_id, **summary}
+        for policy_id, summary in app.policy_enforcer.list_policies().items()
+    ]
     return {'policies': policies}
 
 
@@ -917,8 +920,10 @@ async def _show_policy_impl(
     await app.initialize()
 
     # Get specific policy from policy enforcer
-    policy = await app.policy_enforcer.get_policy(policy_id=policy_id)
-    return {'policy': policy}
+    policy = app.policy_enforcer.get_policy(policy_id)
+    if policy is None:
+        raise ValueError(f"Policy '{policy_id}' not found")
+    return {'policy': policy.model_dump(mode='json')}
 
 
 if __name__ == '__main__':
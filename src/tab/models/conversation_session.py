@@ -489,7 +489,7 @@ class ConversationSession(BaseModel):
             "duration_minutes": duration_minutes,
             "convergence_confidence": convergence_confidence,
             "topic": self.topic,
-            "status": self.status.value
+            "status": SessionStatus(self.status).value
         }
 
     def get_session_status(self) -> Dict[str, Any]:
@@ -559,7 +559,7 @@ class ConversationSession(BaseModel):
             next_actions.append("Session timed out - consider extending or restarting")
 
         return {
-            "status": self.status.value,
+            "status": SessionStatus(self.status).value,
             "turn_progress": {
                 "current": self.current_turn,
                 "max": self.max_turns
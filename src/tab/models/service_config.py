@@ -5,8 +5,8 @@ dependency injection, and service lifecycle configuration.
 """
 
 from datetime import datetime
-from typing import Dict, Any, List, Optional, Union
-from pydantic import BaseModel, Field, validator
+from typing import Dict, Any, List, Literal, Optional, Union
+from pydantic import BaseModel, Field, PrivateAttr, ValidationInfo, field_validator
 
 
 class ServiceContainerConfig(BaseModel):
@@ -45,10 +45,11 @@ class ServiceRegistration(BaseModel):
     health_check_enabled: bool = Field(default=True)
     dependencies: List[str] = Field(default_factory=list)
 
-    @validator('dependencies')
-    def validate_no_circular_dependencies(cls, v, values):
+    @field_validator('dependencies', mode='after')
+    @classmethod
+    def validate_no_circular_dependencies(cls, v: List[str], info: ValidationInfo) -> List[str]:
         """Basic validation to prevent obvious circular dependencies."""
-        service_id = values.get('service_id')
+        service_id = info.data.get('service_id')
         if service_id and service_id in v:
             raise ValueError(f"Service {service_id} cannot depend on itself")
         return v
@@ -58,7 +59,7 @@ class ServiceHealthStatus(BaseModel):
     """Model for service health status tracking."""
 
     service_id: str
-    status: str = Field(..., pattern="^(healthy|unhealthy|unknown|initializing)$")
+    status: Literal["healthy", "unhealthy", "unknown", "initializing"]
     last_check: datetime = Field(default_factory=datetime.utcnow)
     error_count: int = Field(default=0, ge=0)
     uptime_seconds: float = Field(default=0.0, ge=0)
@@ -91,19 +92,17 @@ class ServiceMetricsConfig(BaseModel):
 
     enable_metrics: bool = Field(default=True)
     metric_collection_interval: int = Field(default=30, ge=10)
-    performance_thresholds: Dict[str, float] = Field(default_factory=dict)
+    performance_thresholds: Dict[str, float] = Field(default_factory=lambda: {
+        "response_time_ms": 1000.0,
+        "error_rate_percent": 5.0,
+        "memory_usage_mb": 512.0,
+        "cpu_usage_percent": 80.0
+    })
     alert_on_threshold_breach: bool = Field(default=True)
 
-    # Default performance thresholds
-    def __init__(self, **data):
-        if 'performance_thresholds' not in data:
-            data['performance_thresholds'] = {
-                "response_time_ms": 1000.0,
-                "error_rate_percent": 5.0,
-                "memory_usage_mb": 512.0,
-                "cpu_usage_percent": 80.0
-            }
-        super().__init__(**data)
+
+# ServiceContainerState fields whose assignment changes readiness
+_READINESS_FIELDS = frozenset({"services_registered", "services_initialized", "services_healthy"})
 
 
 class ServiceContainerState(BaseModel):
@@ -117,32 +116,60 @@ class ServiceContainerState(BaseModel):
     last_health_check: Optional[datetime] = None
     configuration_version: str = Field(default="1.0.0")
 
+    # Readiness is recomputed only when one of the service counters changes,
+    # so health loops polling is_ready just read a flag.
+    _is_ready: bool = PrivateAttr(default=False)
+
+    def model_post_init(self, __context: Any) -> None:
+        self._refresh_readiness()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in _READINESS_FIELDS:
+            self._refresh_readiness()
+
+    def _refresh_readiness(self) -> None:
+        self._is_ready = (
+            0 < self.services_registered == self.services_initialized == self.services_healthy
+        )
+
     @property
     def is_ready(self) -> bool:
-        """Check if container is ready to serve requests."""
-        return self.services_initialized == self.services_registered and self.services_healthy == self.services_registered
+        """Check if container is ready to serve requests.
+
+        Ready once every registered service is initialized and healthy. An
+        empty container, with no services registered, is not ready.
+        """
+        return self._is_ready
+
+
+_DEFAULT_CONTAINER_CONFIG = ServiceContainerConfig(
+    session_manager={
+        "storage_directory": "~/.tab/sessions",
+        "auto_cleanup_enabled": True,
+        "cleanup_interval_hours": 24
+    },
+    policy_enforcer={
+        "default_policy": "default",
+        "strict_validation": True
+    },
+    conversation_orchestrator={
+        "max_concurrent_conversations": 10,
+        "turn_timeout_seconds": 120
+    },
+    async_adapter_pool_size=20,
+    circuit_breaker_threshold=5,
+    health_check_interval=60,
+    trace_service_calls=True,
+    log_service_errors=True,
+    metrics_collection=True
+)
 
 
 def create_default_service_container_config() -> ServiceContainerConfig:
-    """Create a default service container configuration."""
-    return ServiceContainerConfig(
-        session_manager={
-            "storage_directory": "~/.tab/sessions",
-            "auto_cleanup_enabled": True,
-            "cleanup_interval_hours": 24
-        },
-        policy_enforcer={
-            "default_policy": "default",
-            "strict_validation": True
-        },
-        conversation_orchestrator={
-            "max_concurrent_conversations": 10,
-            "turn_timeout_seconds": 120
-        },
-        async_adapter_pool_size=20,
-        circuit_breaker_threshold=5,
-        health_check_interval=60,
-        trace_service_calls=True,
-        log_service_errors=True,
-        metrics_collection=True
-    )
\ No newline at end of file
+    """Create a default service container configuration.
+
+    Returns a deep copy of a prototype validated once at import time, so
+    callers may mutate the result freely.
+    """
+    return _DEFAULT_CONTAINER_CONFIG.model_copy(deep=True)
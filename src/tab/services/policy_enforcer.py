@@ -1,16 +1,429 @@
 """Policy enforcement service with security validation."""
 
+import fnmatch
+import hashlib
 import logging
-from typing import Dict, Any, List, Optional, Set
+import re
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import (
+    Dict, Any, Callable, FrozenSet, Iterator, List, Mapping, NamedTuple, Optional, Set, Tuple
+)
 from datetime import datetime, timezone
 
-from tab.models.policy_configuration import PolicyConfiguration, PermissionMode, ResourceLimits
+from tab.models.policy_configuration import (
+    FileAccessRules,
+    PermissionMode,
+    PolicyConfiguration,
+    ResourceLimits,
+)
 from tab.models.audit_record import AuditRecord, EventType
 from tab.models.turn_message import TurnMessage
 
 
 logger = logging.getLogger(__name__)
 
+_GLOB_CHARS = frozenset("*?[")
+
+# (audit action, reason, audit details) describing why a file access was denied
+_Denial = Tuple[str, str, Dict[str, Any]]
+
+# Trie node: child nodes keyed by character, rule payloads listed under ``None``
+_TrieNode = Dict[Optional[str], Any]
+
+# (payloads, (character, id of interned child) pairs) identifying a trie node
+_NodeSignature = Tuple[Tuple[Any, ...], Tuple[Tuple[str, int], ...]]
+
+
+def _permit_all(file_path: str) -> Optional[_Denial]:
+    return None
+
+
+def _literal_prefix(pattern: str) -> str:
+    """Return the part of a glob pattern before its first wildcard."""
+    for index, char in enumerate(pattern):
+        if char in _GLOB_CHARS:
+            return pattern[:index]
+    return pattern
+
+
+def _is_prefix_pattern(pattern: str) -> bool:
+    """Check for ``PREFIX*`` globs, which match exactly the paths starting with PREFIX."""
+    return pattern.endswith("*") and len(_literal_prefix(pattern)) == len(pattern) - 1
+
+
+class _RuleInternPool:
+    """Shares structurally identical compiled rules across policies.
+
+    Compiled tries are read-only once built, so equal trie nodes and glob
+    matchers are hash-consed into single shared instances and memory grows
+    with the number of distinct rules rather than policies x rules.
+    """
+
+    __slots__ = ("_globs", "_nodes", "hits")
+
+    def __init__(self) -> None:
+        self._globs: Dict[str, Tuple[str, Callable[[str], Any]]] = {}
+        self._nodes: Dict[_NodeSignature, _TrieNode] = {}
+        self.hits = 0
+
+    def glob_rule(self, pattern: str) -> Tuple[str, Callable[[str], Any]]:
+        """Return the shared (pattern, matcher) pair for a glob pattern."""
+        rule = self._globs.get(pattern)
+        if rule is None:
+            rule = (pattern, re.compile(fnmatch.translate(pattern)).match)
+            self._globs[pattern] = rule
+        else:
+            self.hits += 1
+        return rule
+
+    def node(self, root: _TrieNode) -> _TrieNode:
+        """Return the canonical instance of a trie, interning children first.
+
+        The trie is walked post-order with an explicit stack, as a single
+        long path would otherwise nest one call per character and exceed
+        the recursion limit.
+        """
+        canonical_of: Dict[int, _TrieNode] = {}
+        stack: List[Tuple[_TrieNode, bool]] = [(root, False)]
+        while stack:
+            node, children_done = stack.pop()
+            if not children_done:
+                stack.append((node, True))
+                stack.extend(
+                    (child, False) for char, child in node.items() if char is not None
+                )
+                continue
+            canonical_of[id(node)] = self._canonical(node, canonical_of)
+        return canonical_of[id(root)]
+
+    def _canonical(self, node: _TrieNode, canonical_of: Dict[int, _TrieNode]) -> _TrieNode:
+        """Intern one node whose children have already been interned."""
+        children: Dict[str, _TrieNode] = {
+            char: canonical_of[id(child)] for char, child in node.items() if char is not None
+        }
+        payloads = tuple(node.get(None, ()))
+        signature: _NodeSignature = (
+            payloads,
+            tuple(sorted((char, id(child)) for char, child in children.items()))
+        )
+
+        shared = self._nodes.get(signature)
+        if shared is not None:
+            self.hits += 1
+            return shared
+
+        canonical: _TrieNode = dict(children.items())
+        if payloads:
+            canonical[None] = list(payloads)
+        self._nodes[signature] = canonical
+        return canonical
+
+    @property
+    def size(self) -> int:
+        """Number of distinct trie nodes held by the pool."""
+        return len(self._nodes)
+
+
+class _PathPrefixTrie:
+    """Character-level trie mapping path prefixes to rule payloads.
+
+    A lookup walks the path once and yields the payloads of every stored key
+    that is a prefix of it (shortest first), so the cost depends on the path
+    length rather than on the number of rules.
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self) -> None:
+        # Child nodes are keyed by character; payloads live under ``None``
+        self._root: _TrieNode = {}
+
+    def insert(self, key: str, payload: Any) -> None:
+        node = self._root
+        for char in key:
+            node = node.setdefault(char, {})
+        node.setdefault(None, []).append(payload)
+
+    def intern(self, pool: _RuleInternPool) -> None:
+        """Replace this trie's nodes with shared instances from the pool."""
+        self._root = pool.node(self._root)
+
+    def prefixes_of(self, path: str) -> Iterator[Any]:
+        node = self._root
+        yield from node.get(None, ())
+        for char in path:
+            child: Optional[_TrieNode] = node.get(char)
+            if child is None:
+                return
+            node = child
+            yield from node.get(None, ())
+
+
+class _FileAccessIndex:
+    """File access rules of one policy, compiled once at load time.
+
+    Patterns of the form ``PREFIX*`` (such as ``/workspace/*``) are plain
+    prefix tests and are checked with a single ``str.startswith`` over a
+    tuple. Remaining glob patterns are bucketed by their literal prefix so
+    only patterns whose prefix matches the requested path are evaluated.
+    Read access, the common
+    case for turn attachments, is additionally specialized into ``read_check``
+    so rule sets a policy does not use are never consulted.
+    """
+
+    __slots__ = (
+        "disallowed", "disallowed_prefixes", "disallowed_prefix_patterns",
+        "allowed", "allowed_prefixes", "readonly", "readonly_paths",
+        "allowed_patterns", "read_check"
+    )
+
+    def __init__(self, rules: FileAccessRules, pool: _RuleInternPool) -> None:
+        disallowed_prefix_patterns = tuple(
+            pattern for pattern in rules.disallowed_patterns if _is_prefix_pattern(pattern)
+        )
+        self.disallowed_prefix_patterns = disallowed_prefix_patterns
+        self.disallowed_prefixes = tuple(pattern[:-1] for pattern in disallowed_prefix_patterns)
+        self.disallowed = self._compile_patterns(
+            [p for p in rules.disallowed_patterns if not _is_prefix_pattern(p)], pool
+        )
+        self.allowed_prefixes = tuple(
+            pattern[:-1] for pattern in rules.allowed_patterns if _is_prefix_pattern(pattern)
+        )
+        self.allowed = self._compile_patterns(
+            [p for p in rules.allowed_patterns if not _is_prefix_pattern(p)], pool
+        )
+        self.allowed_patterns = tuple(rules.allowed_patterns)
+        self.readonly_paths = tuple(rules.readonly_paths)
+        self.readonly = _PathPrefixTrie()
+        for path in rules.readonly_paths:
+            self.readonly.insert(path, path)
+        self.readonly.intern(pool)
+        self.read_check = self._specialize_read_check(
+            bool(rules.disallowed_patterns), bool(rules.allowed_patterns)
+        )
+
+    def _specialize_read_check(
+        self,
+        has_disallowed: bool,
+        has_allowed: bool
+    ) -> Callable[[str], Optional[_Denial]]:
+        if has_disallowed and has_allowed:
+            forbidden, not_allowed = self.forbidden, self.not_allowed
+
+            def read_check(file_path: str) -> Optional[_Denial]:
+                return forbidden(file_path) or not_allowed(file_path)
+
+            return read_check
+        if has_disallowed:
+            return self.forbidden
+        if has_allowed:
+            return self.not_allowed
+        return _permit_all
+
+    @staticmethod
+    def _compile_patterns(patterns: List[str], pool: _RuleInternPool) -> _PathPrefixTrie:
+        trie = _PathPrefixTrie()
+        for pattern in patterns:
+            trie.insert(_literal_prefix(pattern), pool.glob_rule(pattern))
+        trie.intern(pool)
+        return trie
+
+    def match_disallowed(self, file_path: str) -> Optional[str]:
+        """Return the first disallowed pattern matching the path, if any."""
+        if file_path.startswith(self.disallowed_prefixes):
+            # Denial path only: recover which prefix rule matched for reporting
+            for prefix, pattern in zip(
+                self.disallowed_prefixes, self.disallowed_prefix_patterns, strict=True
+            ):
+                if file_path.startswith(prefix):
+                    return pattern
+        for pattern, matcher in self.disallowed.prefixes_of(file_path):
+            if matcher(file_path):
+                return pattern
+        return None
+
+    def is_allowed(self, file_path: str) -> bool:
+        """Check the path against the allow list (no allow list allows all)."""
+        if not self.allowed_patterns or file_path.startswith(self.allowed_prefixes):
+            return True
+        return any(matcher(file_path) for _, matcher in self.allowed.prefixes_of(file_path))
+
+    def match_readonly(self, file_path: str) -> Optional[str]:
+        """Return the shortest read-only path containing the path, if any."""
+        if not file_path.startswith(self.readonly_paths):
+            return None
+        return next(self.readonly.prefixes_of(file_path), None)
+
+    def forbidden(self, file_path: str) -> Optional[_Denial]:
+        forbidden_path = self.match_disallowed(file_path)
+        if forbidden_path is None:
+            return None
+        return (
+            "file_access_forbidden",
+            f"File path {file_path} is in forbidden area {forbidden_path}",
+            {"forbidden_path": forbidden_path}
+        )
+
+    def readonly_violation(self, file_path: str) -> Optional[_Denial]:
+        readonly_path = self.match_readonly(file_path)
+        if readonly_path is None:
+            return None
+        return (
+            "file_access_readonly_violation",
+            f"Write/execute access denied to read-only path {readonly_path}",
+            {"readonly_path": readonly_path}
+        )
+
+    def not_allowed(self, file_path: str) -> Optional[_Denial]:
+        if self.is_allowed(file_path):
+            return None
+        return (
+            "file_access_not_allowed",
+            f"File path {file_path} is not in allowed paths",
+            {"allowed_paths": list(self.allowed_patterns)}
+        )
+
+
+class _ToolIndex(NamedTuple):
+    """Tool lists of one policy as frozensets for O(1) membership checks."""
+
+    allowed: FrozenSet[str]
+    disallowed: FrozenSet[str]
+    approval_required: FrozenSet[str]
+
+
+class _ResourceCheck(NamedTuple):
+    """One precompiled resource limit comparison."""
+
+    usage_key: str
+    default: float
+    limit: float
+    code: str
+    message: str
+
+
+# (usage key, ResourceLimits field, default usage, violation code, violation message template)
+_RESOURCE_LIMIT_FIELDS = (
+    ("execution_time_seconds", "max_execution_time_seconds", 0, "execution_time_exceeded",
+     "Execution time {value}s exceeds limit {limit}s"),
+    ("cost_usd", "max_cost_usd", 0.0, "cost_exceeded", "Cost ${value} exceeds limit ${limit}"),
+    ("memory_mb", "max_memory_mb", 0, "memory_exceeded", "Memory {value}MB exceeds limit {limit}MB"),
+    ("file_size_mb", "max_file_size_mb", 0, "file_size_exceeded",
+     "File size {value}MB exceeds limit {limit}MB"),
+)
+
+# Linux capabilities in kernel bit order (include/uapi/linux/capability.h)
+_LINUX_CAPABILITIES = (
+    "CHOWN", "DAC_OVERRIDE", "DAC_READ_SEARCH", "FOWNER", "FSETID", "KILL", "SETGID",
+    "SETUID", "SETPCAP", "LINUX_IMMUTABLE", "NET_BIND_SERVICE", "NET_BROADCAST",
+    "NET_ADMIN", "NET_RAW", "IPC_LOCK", "IPC_OWNER", "SYS_MODULE", "SYS_RAWIO",
+    "SYS_CHROOT", "SYS_PTRACE", "SYS_PACCT", "SYS_ADMIN", "SYS_BOOT", "SYS_NICE",
+    "SYS_RESOURCE", "SYS_TIME", "SYS_TTY_CONFIG", "MKNOD", "LEASE", "AUDIT_WRITE",
+    "AUDIT_CONTROL", "SETFCAP", "MAC_OVERRIDE", "MAC_ADMIN", "SYSLOG", "WAKE_ALARM",
+    "BLOCK_SUSPEND", "AUDIT_READ", "PERFMON", "BPF", "CHECKPOINT_RESTORE",
+)
+_CAPABILITY_BITS = {name: 1 << bit for bit, name in enumerate(_LINUX_CAPABILITIES)}
+_ALL_CAPABILITIES = (1 << len(_LINUX_CAPABILITIES)) - 1
+
+
+def _capability_mask(names: List[str]) -> Tuple[int, Tuple[str, ...]]:
+    """Fold capability names into a bitmask.
+
+    Names are matched case-insensitively with or without the ``CAP_`` prefix,
+    and ``ALL`` sets every bit.
+
+    Returns:
+        The bitmask and the names that were not recognized
+    """
+    mask = 0
+    unknown = []
+    for name in names:
+        key = name.strip().upper().removeprefix("CAP_")
+        if key == "ALL":
+            mask |= _ALL_CAPABILITIES
+        elif key in _CAPABILITY_BITS:
+            mask |= _CAPABILITY_BITS[key]
+        else:
+            unknown.append(name)
+    return mask, tuple(unknown)
+
+
+def _capability_names(mask: int) -> List[str]:
+    return [f"CAP_{name}" for name, bit in _CAPABILITY_BITS.items() if mask & bit]
+
+
+# Allow results carry no per-call data, so one read-only instance is shared
+_TOOL_ALLOWED: Mapping[str, Any] = MappingProxyType({
+    "allowed": True,
+    "reason": "Tool usage permitted by policy",
+    "action_required": "none"
+})
+_FILE_ACCESS_ALLOWED: Mapping[str, Any] = MappingProxyType({
+    "allowed": True,
+    "reason": "File access permitted by policy",
+    "action_required": "none"
+})
+_RESOURCES_WITHIN_LIMITS: Mapping[str, Any] = MappingProxyType({
+    "allowed": True,
+    "reason": "Resource usage within policy limits",
+    "action_required": "none"
+})
+
+# Machine-readable violation codes returned next to the human-readable messages
+_NO_VIOLATION_CODES: FrozenSet[str] = frozenset()
+_POLICY_NOT_FOUND_CODES: FrozenSet[str] = frozenset({"policy_not_found"})
+
+
+def _compile_resource_checks(limits: ResourceLimits) -> Tuple[_ResourceCheck, ...]:
+    """Flatten resource limits into the comparisons that apply to a policy."""
+    checks = []
+    for usage_key, limit_field, default, code, message in _RESOURCE_LIMIT_FIELDS:
+        limit = getattr(limits, limit_field)
+        # A zero cost limit marks subscription-based services; cost is not checked
+        if limit_field == "max_cost_usd" and limit <= 0.0:
+            continue
+        checks.append(_ResourceCheck(usage_key, default, limit, code, message))
+    return tuple(checks)
+
+
+@dataclass(slots=True, frozen=True)
+class _CompiledPolicy:
+    """Load-time compiled view of a PolicyConfiguration for hot-path checks."""
+
+    policy: PolicyConfiguration
+    digest: bytes
+    tools: _ToolIndex
+    file_access: _FileAccessIndex
+    resource_checks: Tuple[_ResourceCheck, ...]
+    dropped_capabilities: int
+    summary: Dict[str, Any]
+
+    @classmethod
+    def compile(cls, policy: PolicyConfiguration, pool: _RuleInternPool) -> "_CompiledPolicy":
+        # Digest ignores timestamps so identical policy content shares validation results
+        content = policy.model_dump_json(exclude={"created_at", "updated_at"})
+        return cls(
+            policy=policy,
+            digest=hashlib.blake2b(content.encode(), digest_size=16).digest(),
+            tools=_ToolIndex(
+                allowed=frozenset(policy.allowed_tools),
+                disallowed=frozenset(policy.disallowed_tools),
+                approval_required=frozenset(policy.approval_required)
+            ),
+            file_access=_FileAccessIndex(policy.file_access_rules, pool),
+            resource_checks=_compile_resource_checks(policy.resource_limits),
+            dropped_capabilities=_capability_mask(policy.sandbox_config.capabilities_dropped)[0],
+            summary={
+                "name": policy.name,
+                "description": policy.description,
+                # use_enum_values stores the mode as a plain string
+                "permission_mode": PermissionMode(policy.permission_mode).value,
+                "allowed_tools_count": len(policy.allowed_tools),
+                "disallowed_tools_count": len(policy.disallowed_tools)
+            }
+        )
+
 
 class PolicyEnforcer:
     """Service for enforcing security policies and permission controls."""
@@ -23,6 +436,9 @@ class PolicyEnforcer:
         """
         self.logger = logging.getLogger(__name__)
         self._policies: Dict[str, PolicyConfiguration] = {}
+        self._compiled: Dict[str, _CompiledPolicy] = {}
+        self._rule_pool = _RuleInternPool()
+        self._validation_cache: Dict[bytes, Dict[str, Any]] = {}
         self._audit_records: List[AuditRecord] = []
         self._config = config
         self._load_policies_from_config()
@@ -45,6 +461,19 @@ class PolicyEnforcer:
         if not self._policies:
             self._load_default_policies()
 
+        self._compile_policies()
+
+    def _compile_policies(self) -> None:
+        """Precompile per-policy rule indexes used on the validation hot path."""
+        self._compiled = {
+            policy_id: _CompiledPolicy.compile(policy, self._rule_pool)
+            for policy_id, policy in self._policies.items()
+        }
+        self.logger.debug(
+            f"Compiled {len(self._compiled)} policies: {self._rule_pool.size} distinct "
+            f"rule nodes, {self._rule_pool.hits} shared"
+        )
+
     def _load_default_policies(self) -> None:
         """Load default policy configurations."""
         # Default development policy
@@ -62,9 +491,9 @@ class PolicyEnforcer:
                 max_file_size_mb=10
             ),
             file_access_rules={
-                "allowed_paths": ["/workspace", "/tmp"],
+                "allowed_patterns": ["/workspace/*", "/tmp/*"],
                 "readonly_paths": ["/usr", "/etc", "/bin"],
-                "forbidden_paths": ["/proc", "/sys", "/dev"]
+                "disallowed_patterns": ["/proc/*", "/sys/*", "/dev/*"]
             },
             network_access_rules={
                 "allowed": False,
@@ -88,9 +517,9 @@ class PolicyEnforcer:
                 max_file_size_mb=5
             ),
             file_access_rules={
-                "allowed_paths": ["/workspace"],
+                "allowed_patterns": ["/workspace/*"],
                 "readonly_paths": ["/workspace", "/usr", "/etc"],
-                "forbidden_paths": ["/proc", "/sys", "/dev", "/tmp"]
+                "disallowed_patterns": ["/proc/*", "/sys/*", "/dev/*", "/tmp/*"]
             },
             network_access_rules={
                 "allowed": False,
@@ -114,9 +543,9 @@ class PolicyEnforcer:
                 max_file_size_mb=20
             ),
             file_access_rules={
-                "allowed_paths": ["/workspace", "/tmp"],
+                "allowed_patterns": ["/workspace/*", "/tmp/*"],
                 "readonly_paths": ["/usr", "/etc"],
-                "forbidden_paths": ["/proc", "/sys", "/dev"]
+                "disallowed_patterns": ["/proc/*", "/sys/*", "/dev/*"]
             },
             network_access_rules={
                 "allowed": True,
@@ -132,22 +561,97 @@ class PolicyEnforcer:
         }
 
     def get_policy(self, policy_id: str) -> Optional[PolicyConfiguration]:
-        """Get policy configuration by ID.
+        """Get a copy of a policy configuration by ID.
+
+        Changes made to the copy are not enforced until it is passed to
+        ``reload_policy``.
+
+        Args:
+            policy_id: Policy identifier
+
+        Returns:
+            Deep copy of the PolicyConfiguration if found, None otherwise
+        """
+        policy = self._policies.get(policy_id)
+        return policy.model_copy(deep=True) if policy is not None else None
+
+    def reload_policy(self, policy_id: str, policy: PolicyConfiguration) -> None:
+        """Replace a loaded policy and recompile its indexes.
+
+        Args:
+            policy_id: Policy identifier
+            policy: Updated policy, typically an edited copy from ``get_policy``
+
+        Raises:
+            KeyError: If the policy is not loaded
+        """
+        previous = self._compiled[policy_id]
+        policy = policy.model_copy(deep=True)
+        self._policies[policy_id] = policy
+        self._compiled[policy_id] = _CompiledPolicy.compile(policy, self._rule_pool)
+
+        # Drop the cached validation of the old content unless another policy shares it
+        if all(compiled.digest != previous.digest for compiled in self._compiled.values()):
+            self._validation_cache.pop(previous.digest, None)
+
+    def validate_policy(self, policy_id: str) -> Dict[str, Any]:
+        """Run structural consistency checks on a loaded policy.
+
+        Results are cached by a digest of the policy content taken when the
+        policy was compiled, so policies with identical content share one
+        validation run. Loaded policies cannot be edited in place, as
+        ``get_policy`` hands out copies, and ``reload_policy`` recompiles the
+        digest, so it stays current.
 
         Args:
             policy_id: Policy identifier
 
         Returns:
-            PolicyConfiguration if found, None otherwise
+            Validation result with valid flag and list of errors
         """
-        return self._policies.get(policy_id)
+        compiled = self._compiled.get(policy_id)
+        if compiled is None:
+            return {
+                "valid": False,
+                "errors": [f"Policy '{policy_id}' not found"],
+                "policy_id": policy_id
+            }
+
+        cached = self._validation_cache.get(compiled.digest)
+        if cached is None:
+            cached = self._check_policy(compiled.policy, compiled.tools)
+            self._validation_cache[compiled.digest] = cached
+
+        return {
+            "valid": cached["valid"],
+            "errors": list(cached["errors"]),
+            "policy_id": policy_id
+        }
+
+    def _check_policy(self, policy: PolicyConfiguration, tools: _ToolIndex) -> Dict[str, Any]:
+        """Evaluate policy consistency rules not covered by model validation."""
+        errors = []
+
+        overlap = tools.allowed & tools.disallowed
+        if overlap:
+            errors.append(f"allowed_tools and disallowed_tools overlap: {sorted(overlap)}")
+
+        all_tools = tools.allowed | tools.disallowed | tools.approval_required
+        if any(not tool.strip() for tool in all_tools):
+            errors.append("Tool names cannot be empty")
+
+        _, unknown_capabilities = _capability_mask(policy.sandbox_config.capabilities_dropped)
+        if unknown_capabilities:
+            errors.append(f"Unknown capabilities in capabilities_dropped: {list(unknown_capabilities)}")
+
+        return {"valid": not errors, "errors": errors}
 
     def validate_tool_usage(
         self,
         policy_id: str,
         tool_name: str,
         session_id: Optional[str] = None
-    ) -> Dict[str, Any]:
+    ) -> Mapping[str, Any]:
         """Validate if tool usage is allowed by policy.
 
         Args:
@@ -156,13 +660,14 @@ class PolicyEnforcer:
             session_id: Optional session identifier
 
         Returns:
-            Validation result with allowed status and details
+            Validation result with allowed status and details; allow
+            results are shared read-only mappings
         """
-        policy = self.get_policy(policy_id)
-        if not policy:
+        compiled = self._compiled.get(policy_id)
+        if compiled is None:
             self._create_audit_record(
                 session_id, EventType.SECURITY, "policy_not_found",
-                "failed", {"policy_id": policy_id, "tool_name": tool_name}
+                "failure", {"policy_id": policy_id, "tool_name": tool_name}
             )
             return {
                 "allowed": False,
@@ -170,8 +675,10 @@ class PolicyEnforcer:
                 "action_required": "block"
             }
 
+        tools = compiled.tools
+
         # Check if tool is explicitly disallowed
-        if tool_name in policy.disallowed_tools:
+        if tool_name in tools.disallowed:
             self._create_audit_record(
                 session_id, EventType.SECURITY, "tool_disallowed",
                 "blocked", {"policy_id": policy_id, "tool_name": tool_name}
@@ -183,7 +690,7 @@ class PolicyEnforcer:
             }
 
         # Check if tool is in allowed list (if list exists)
-        if policy.allowed_tools and tool_name not in policy.allowed_tools:
+        if tools.allowed and tool_name not in tools.allowed:
             self._create_audit_record(
                 session_id, EventType.SECURITY, "tool_not_allowed",
                 "blocked", {"policy_id": policy_id, "tool_name": tool_name}
@@ -200,11 +707,7 @@ class PolicyEnforcer:
             "success", {"policy_id": policy_id, "tool_name": tool_name}
         )
 
-        return {
-            "allowed": True,
-            "reason": "Tool usage permitted by policy",
-            "action_required": "none"
-        }
+        return _TOOL_ALLOWED
 
     def validate_file_access(
         self,
@@ -212,7 +715,7 @@ class PolicyEnforcer:
         file_path: str,
         access_type: str,
         session_id: Optional[str] = None
-    ) -> Dict[str, Any]:
+    ) -> Mapping[str, Any]:
         """Validate file access against policy rules.
 
         Args:
@@ -222,104 +725,81 @@ class PolicyEnforcer:
             session_id: Optional session identifier
 
         Returns:
-            Validation result with allowed status and details
+            Validation result with allowed status and details; allow
+            results are shared read-only mappings
         """
-        policy = self.get_policy(policy_id)
-        if not policy:
+        compiled = self._compiled.get(policy_id)
+        if compiled is None:
             return {
                 "allowed": False,
                 "reason": f"Policy {policy_id} not found",
                 "action_required": "block"
             }
 
-        file_rules = policy.file_access_rules
-
-        # Check forbidden paths first
-        forbidden_paths = file_rules.get("forbidden_paths", [])
-        for forbidden_path in forbidden_paths:
-            if file_path.startswith(forbidden_path):
-                self._create_audit_record(
-                    session_id, EventType.SECURITY, "file_access_forbidden",
-                    "blocked", {
-                        "policy_id": policy_id,
-                        "file_path": file_path,
-                        "access_type": access_type,
-                        "forbidden_path": forbidden_path
-                    }
-                )
-                return {
-                    "allowed": False,
-                    "reason": f"File path {file_path} is in forbidden area {forbidden_path}",
-                    "action_required": "block"
-                }
+        denial = self._file_access_denial(compiled.file_access, file_path, access_type)
+        self._audit_file_access(session_id, policy_id, file_path, access_type, denial)
+        if denial is not None:
+            return {
+                "allowed": False,
+                "reason": denial[1],
+                "action_required": "block"
+            }
 
-        # Check if write access to read-only paths
-        if access_type in ["write", "execute"]:
-            readonly_paths = file_rules.get("readonly_paths", [])
-            for readonly_path in readonly_paths:
-                if file_path.startswith(readonly_path):
-                    self._create_audit_record(
-                        session_id, EventType.SECURITY, "file_access_readonly_violation",
-                        "blocked", {
-                            "policy_id": policy_id,
-                            "file_path": file_path,
-                            "access_type": access_type,
-                            "readonly_path": readonly_path
-                        }
-                    )
-                    return {
-                        "allowed": False,
-                        "reason": f"Write/execute access denied to read-only path {readonly_path}",
-                        "action_required": "block"
-                    }
-
-        # Check allowed paths
-        allowed_paths = file_rules.get("allowed_paths", [])
-        if allowed_paths:
-            path_allowed = False
-            for allowed_path in allowed_paths:
-                if file_path.startswith(allowed_path):
-                    path_allowed = True
-                    break
-
-            if not path_allowed:
-                self._create_audit_record(
-                    session_id, EventType.SECURITY, "file_access_not_allowed",
-                    "blocked", {
-                        "policy_id": policy_id,
-                        "file_path": file_path,
-                        "access_type": access_type,
-                        "allowed_paths": allowed_paths
-                    }
-                )
-                return {
-                    "allowed": False,
-                    "reason": f"File path {file_path} is not in allowed paths",
-                    "action_required": "block"
-                }
+        return _FILE_ACCESS_ALLOWED
 
-        # File access is allowed
-        self._create_audit_record(
-            session_id, EventType.ACTION, "file_access_allowed",
-            "success", {
-                "policy_id": policy_id,
-                "file_path": file_path,
-                "access_type": access_type
-            }
+    @staticmethod
+    def _file_access_denial(
+        file_index: _FileAccessIndex,
+        file_path: str,
+        access_type: str
+    ) -> Optional[_Denial]:
+        """Evaluate compiled file rules for a single path.
+
+        Returns:
+            ``(audit action, reason, audit details)`` when access is denied,
+            otherwise None
+        """
+        if access_type not in ("write", "execute"):
+            return file_index.read_check(file_path)
+
+        # Forbidden patterns take precedence over read-only and allow rules
+        return (
+            file_index.forbidden(file_path)
+            or file_index.readonly_violation(file_path)
+            or file_index.not_allowed(file_path)
         )
 
-        return {
-            "allowed": True,
-            "reason": "File access permitted by policy",
-            "action_required": "none"
+    def _audit_file_access(
+        self,
+        session_id: Optional[str],
+        policy_id: str,
+        file_path: str,
+        access_type: str,
+        denial: Optional[_Denial]
+    ) -> None:
+        """Record the outcome of a file access check."""
+        details = {
+            "policy_id": policy_id,
+            "file_path": file_path,
+            "access_type": access_type
         }
+        if denial is None:
+            self._create_audit_record(
+                session_id, EventType.ACTION, "file_access_allowed", "success", details
+            )
+        else:
+            action, _, extra = denial
+            details.update(extra)
+            self._create_audit_record(
+                session_id, EventType.SECURITY, action, "blocked", details
+            )
 
     def validate_resource_limits(
         self,
         policy_id: str,
         resource_usage: Dict[str, Any],
         session_id: Optional[str] = None
-    ) -> Dict[str, Any]:
+    ) -> Mapping[str, Any]:
         """Validate resource usage against policy limits.
 
         Args:
@@ -328,38 +808,24 @@ class PolicyEnforcer:
             session_id: Optional session identifier
 
         Returns:
-            Validation result with allowed status and details
+            Validation result with allowed status and details; allow
+            results are shared read-only mappings
         """
-        policy = self.get_policy(policy_id)
-        if not policy:
+        compiled = self._compiled.get(policy_id)
+        if compiled is None:
             return {
                 "allowed": False,
                 "reason": f"Policy {policy_id} not found",
                 "action_required": "block"
             }
 
-        limits = policy.resource_limits
         violations = []
-
-        # Check execution time
-        execution_time = resource_usage.get("execution_time_seconds", 0)
-        if execution_time > limits.max_execution_time_seconds:
-            violations.append(f"Execution time {execution_time}s exceeds limit {limits.max_execution_time_seconds}s")
-
-        # Check cost (skip for subscription-based services with max_cost_usd = 0.0)
-        cost_usd = resource_usage.get("cost_usd", 0.0)
-        if limits.max_cost_usd > 0.0 and cost_usd > limits.max_cost_usd:
-            violations.append(f"Cost ${cost_usd} exceeds limit ${limits.max_cost_usd}")
-
-        # Check memory
-        memory_mb = resource_usage.get("memory_mb", 0)
-        if memory_mb > limits.max_memory_mb:
-            violations.append(f"Memory {memory_mb}MB exceeds limit {limits.max_memory_mb}MB")
-
-        # Check file size
-        file_size_mb = resource_usage.get("file_size_mb", 0)
-        if file_size_mb > limits.max_file_size_mb:
-            violations.append(f"File size {file_size_mb}MB exceeds limit {limits.max_file_size_mb}MB")
+        violation_codes = set()
+        for check in compiled.resource_checks:
+            value = resource_usage.get(check.usage_key, check.default)
+            if value > check.limit:
+                violations.append(check.message.format(value=value, limit=check.limit))
+                violation_codes.add(check.code)
 
         if violations:
             self._create_audit_record(
@@ -374,14 +840,11 @@ class PolicyEnforcer:
                 "allowed": False,
                 "reason": f"Resource limit violations: {'; '.join(violations)}",
                 "action_required": "block",
-                "violations": violations
+                "violations": violations,
+                "violation_codes": frozenset(violation_codes)
             }
 
-        return {
-            "allowed": True,
-            "reason": "Resource usage within policy limits",
-            "action_required": "none"
-        }
+        return _RESOURCES_WITHIN_LIMITS
 
     def validate_network_access(
         self,
@@ -401,7 +864,7 @@ class PolicyEnforcer:
         Returns:
             Validation result with allowed status and details
         """
-        policy = self.get_policy(policy_id)
+        policy = self._policies.get(policy_id)
         if not policy:
             return {
                 "allowed": False,
@@ -479,6 +942,47 @@ class PolicyEnforcer:
             "action_required": "none"
         }
 
+    def validate_sandbox_config(
+        self,
+        policy_id: str,
+        required_drops: List[str]
+    ) -> Dict[str, Any]:
+        """Check that a policy's sandbox drops the capabilities a caller requires.
+
+        Args:
+            policy_id: Policy to enforce
+            required_drops: Capability names that must be dropped (``ALL`` for every one)
+
+        Returns:
+            Validation result with valid flag, errors and missing capabilities
+        """
+        compiled = self._compiled.get(policy_id)
+        if compiled is None:
+            return {
+                "valid": False,
+                "errors": [f"Policy '{policy_id}' not found"],
+                "policy_id": policy_id
+            }
+
+        sandbox_enabled = compiled.policy.sandbox_config.enabled
+        required, unknown = _capability_mask(required_drops)
+        dropped = compiled.dropped_capabilities if sandbox_enabled else 0
+        missing = _capability_names(required & ~dropped)
+
+        errors = []
+        if unknown:
+            errors.append(f"Unknown capabilities: {list(unknown)}")
+        if missing:
+            errors.append(f"Sandbox does not drop required capabilities: {missing}")
+
+        return {
+            "valid": not errors,
+            "errors": errors,
+            "missing_capabilities": missing,
+            "sandbox_enabled": sandbox_enabled,
+            "policy_id": policy_id
+        }
+
     def enforce_turn_message_policy(
         self,
         policy_id: str,
@@ -493,33 +997,49 @@ class PolicyEnforcer:
         Returns:
             Enforcement result with any violations
         """
-        policy = self.get_policy(policy_id)
-        if not policy:
+        compiled = self._compiled.get(policy_id)
+        if compiled is None:
             return {
                 "allowed": False,
                 "violations": [f"Policy {policy_id} not found"],
+                "violation_codes": _POLICY_NOT_FOUND_CODES,
                 "action_required": "block"
             }
 
+        return self._enforce_turn_message(policy_id, compiled, turn_message)
+
+    def _enforce_turn_message(
+        self,
+        policy_id: str,
+        compiled: _CompiledPolicy,
+        turn_message: TurnMessage
+    ) -> Dict[str, Any]:
+        """Run all turn message checks against an already resolved policy."""
         violations = []
+        violation_codes = set()
+        session_id = turn_message.session_id
+        attachments = turn_message.attachments
 
         # Check content length limits (basic validation)
         if len(turn_message.content) > 50000:  # Max content length
             violations.append("Message content exceeds maximum length")
+            violation_codes.add("content_too_long")
 
         # Check attachment limits
-        if len(turn_message.attachments) > 10:
+        if len(attachments) > 10:
             violations.append("Too many attachments")
+            violation_codes.add("too_many_attachments")
 
-        # Validate file attachments against policy
-        for attachment in turn_message.attachments:
-            file_path = attachment.get("path", "")
+        # Validate file attachments against the compiled rules in the same pass
+        read_check = compiled.file_access.read_check
+        for attachment in attachments:
+            file_path = attachment.path
             if file_path:
-                file_validation = self.validate_file_access(
-                    policy_id, file_path, "read", turn_message.session_id
-                )
-                if not file_validation["allowed"]:
-                    violations.append(f"Attachment access denied: {file_validation['reason']}")
+                denial = read_check(file_path)
+                self._audit_file_access(session_id, policy_id, file_path, "read", denial)
+                if denial is not None:
+                    violations.append(f"Attachment access denied: {denial[1]}")
+                    violation_codes.add(f"attachment_denied:{file_path}")
 
         # Add policy constraints to turn message
         for violation in violations:
@@ -532,7 +1052,7 @@ class PolicyEnforcer:
 
         if violations:
             self._create_audit_record(
-                turn_message.session_id, EventType.SECURITY, "turn_message_policy_violation",
+                session_id, EventType.SECURITY, "turn_message_policy_violation",
                 "blocked", {
                     "policy_id": policy_id,
                     "turn_id": turn_message.turn_id,
@@ -542,12 +1062,14 @@ class PolicyEnforcer:
             return {
                 "allowed": False,
                 "violations": violations,
+                "violation_codes": frozenset(violation_codes),
                 "action_required": "block"
             }
 
         return {
             "allowed": True,
             "violations": [],
+            "violation_codes": _NO_VIOLATION_CODES,
             "action_required": "none"
         }
 
@@ -565,17 +1087,19 @@ class PolicyEnforcer:
         Returns:
             Validation result with allowed status and details
         """
-        policy = self.get_policy(policy_id)
+        policy = self._policies.get(policy_id)
         if not policy:
             return {
                 "allowed": False,
                 "violations": [f"Policy {policy_id} not found"],
+                "violation_codes": _POLICY_NOT_FOUND_CODES,
                 "warnings": [],
                 "policy_id": policy_id,
                 "validation_time": datetime.now(timezone.utc).isoformat()
             }
 
         violations = []
+        violation_codes = set()
         warnings = []
 
         # Validate basic session parameters
@@ -585,19 +1109,23 @@ class PolicyEnforcer:
         # Check resource limits
         if budget_usd > policy.resource_limits.max_cost_usd:
             violations.append(f"Session budget ${budget_usd} exceeds policy limit ${policy.resource_limits.max_cost_usd}")
+            violation_codes.add("budget_exceeds_limit")
 
         # Check turn limits
         if max_turns > 20:  # Reasonable upper bound
             violations.append(f"Session max_turns {max_turns} exceeds reasonable limit")
+            violation_codes.add("max_turns_exceeds_limit")
 
         # Check participants
         participants = session_params.get("participants", [])
         if len(participants) < 2:
             violations.append("Session must have at least 2 participants")
+            violation_codes.add("too_few_participants")
 
         return {
             "allowed": len(violations) == 0,
             "violations": violations,
+            "violation_codes": frozenset(violation_codes),
             "warnings": warnings,
             "policy_id": policy_id,
             "validation_time": datetime.now(timezone.utc).isoformat()
@@ -619,35 +1147,41 @@ class PolicyEnforcer:
         Returns:
             Validation result with allowed status and details
         """
-        policy = self.get_policy(policy_id)
-        if not policy:
+        compiled = self._compiled.get(policy_id)
+        if compiled is None:
             return {
                 "allowed": False,
                 "violations": [f"Policy {policy_id} not found"],
+                "violation_codes": _POLICY_NOT_FOUND_CODES,
                 "warnings": [],
                 "policy_id": policy_id,
                 "validation_time": datetime.now(timezone.utc).isoformat()
             }
 
         violations = []
+        violation_codes = set()
         warnings = []
 
         # Check if session is within turn limits
         if session.current_turn >= session.max_turns:
             violations.append(f"Session has reached maximum turns ({session.max_turns})")
+            violation_codes.add("max_turns_reached")
 
         # Check if session is within budget
         if session.total_cost_usd >= session.budget_usd:
             violations.append(f"Session has exceeded budget (${session.budget_usd})")
+            violation_codes.add("budget_exhausted")
 
         # Validate turn message content
-        turn_validation = self.enforce_turn_message_policy(policy_id, turn)
+        turn_validation = self._enforce_turn_message(policy_id, compiled, turn)
         if not turn_validation["allowed"]:
             violations.extend(turn_validation["violations"])
+            violation_codes.update(turn_validation["violation_codes"])
 
         return {
             "allowed": len(violations) == 0,
             "violations": violations,
+            "violation_codes": frozenset(violation_codes),
             "warnings": warnings,
             "policy_id": policy_id,
             "validation_time": datetime.now(timezone.utc).isoformat()
@@ -722,13 +1256,8 @@ class PolicyEnforcer:
         Returns:
             Dictionary of policy summaries
         """
+        # Summaries are built when policies are compiled; hand out copies
         return {
-            policy_id: {
-                "name": policy.name,
-                "description": policy.description,
-                "permission_mode": policy.permission_mode.value,
-                "allowed_tools_count": len(policy.allowed_tools),
-                "disallowed_tools_count": len(policy.disallowed_tools)
-            }
-            for policy_id, policy in self._policies.items()
+            policy_id: dict(compiled.summary)
+            for policy_id, compiled in self._compiled.items()
         }
\ No newline at end of file
@@ -1,14 +1,14 @@
 """Session manager with state persistence."""
 
 import asyncio
-import json
 import logging
 import os
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Mapping
+from typing import Any, Dict, Iterable, List, Optional, Mapping, Set, Tuple, cast
 
 from pydantic import BaseModel
+from pydantic_core import from_json, to_json
 import aiofiles
 
 from tab.models.conversation_session import ConversationSession, SessionStatus
@@ -18,6 +18,12 @@ from tab.models.audit_record import AuditRecord
 
 logger = logging.getLogger(__name__)
 
+# Version tag written into every persisted session record
+_STORAGE_VERSION = "1.0"
+
+# Upper bound on session files read concurrently during startup recovery
+_RECOVERY_CONCURRENCY = 64
+
 
 class SessionManager:
     """Manages conversation session lifecycle and state persistence."""
@@ -42,6 +48,19 @@ class SessionManager:
         self._orchestration_states: Dict[str, OrchestrationState] = {}
         self._session_locks: Dict[str, asyncio.Lock] = {}
 
+        # IDs of sessions that were active when last created, updated or
+        # loaded through this manager
+        self._active_session_ids: Set[str] = set()
+
+        # Number of turns already appended to each session's log, and the
+        # session fields and orchestration state as last written to it
+        self._persisted_turns: Dict[str, int] = {}
+        self._persisted_state: Dict[str, Dict[str, Any]] = {}
+
+        # Set once every stored session has been loaded into memory; from then
+        # on the in-memory cache is authoritative and storage is only written
+        self._storage_loaded = False
+
         # Cleanup configuration from config
         self.auto_cleanup_enabled = config_data.get("auto_cleanup_enabled", True)
         self.cleanup_interval_hours = config_data.get("cleanup_interval_hours", 24)
@@ -119,11 +138,13 @@ class SessionManager:
 
         # Store in memory and create lock
         self._sessions[session.session_id] = session
+        self._index_status(session.session_id, session.status)
         self._orchestration_states[session.session_id] = orchestration_state
         self._session_locks[session.session_id] = asyncio.Lock()
 
         # Persist to storage
-        await self._save_session_to_storage(session, orchestration_state)
+        async with self._session_locks[session.session_id]:
+            await self._save_session_to_storage(session, orchestration_state)
 
         self.logger.info(f"Created session {session.session_id} with {len(participants)} participants")
         return session
@@ -142,14 +163,7 @@ class SessionManager:
             return self._sessions[session_id]
 
         # Try loading from storage
-        session = await self._load_session_from_storage(session_id)
-        if session:
-            # Cache in memory
-            self._sessions[session_id] = session
-            if session_id not in self._session_locks:
-                self._session_locks[session_id] = asyncio.Lock()
-
-        return session
+        return await self._load_into_memory(session_id)
 
     async def get_orchestration_state(self, session_id: str) -> Optional[OrchestrationState]:
         """Get orchestration state for session.
@@ -165,11 +179,8 @@ class SessionManager:
             return self._orchestration_states[session_id]
 
         # Try loading from storage
-        state = await self._load_orchestration_state_from_storage(session_id)
-        if state:
-            self._orchestration_states[session_id] = state
-
-        return state
+        await self._load_into_memory(session_id)
+        return self._orchestration_states.get(session_id)
 
     async def update_session(
         self,
@@ -194,11 +205,13 @@ class SessionManager:
             try:
                 # Update memory cache
                 self._sessions[session_id] = session
+                self._index_status(session_id, session.status)
                 if orchestration_state:
                     self._orchestration_states[session_id] = orchestration_state
 
-                # Persist to storage
-                await self._save_session_to_storage(session, orchestration_state)
+                # Persist to storage, keeping the cached orchestration state
+                # when none was passed
+                await self._save_session_to_storage(session, self._orchestration_states.get(session_id))
 
                 return True
 
@@ -218,13 +231,16 @@ class SessionManager:
         try:
             # Remove from memory
             self._sessions.pop(session_id, None)
+            self._unindex_status(session_id)
             self._orchestration_states.pop(session_id, None)
             self._session_locks.pop(session_id, None)
+            self._persisted_turns.pop(session_id, None)
+            self._persisted_state.pop(session_id, None)
 
-            # Remove from storage
-            session_file = self.storage_path / f"{session_id}.json"
-            if session_file.exists():
-                session_file.unlink()
+            # Remove from storage, including any legacy snapshot
+            for session_file in (self._log_path(session_id), self._legacy_path(session_id)):
+                if session_file.exists():
+                    session_file.unlink()
 
             self.logger.info(f"Deleted session {session_id}")
             return True
@@ -249,26 +265,17 @@ class SessionManager:
         Returns:
             List of session summaries
         """
-        sessions = []
+        # Bring any storage-only sessions into memory, then serve from memory
+        for session_id in await self._unloaded_storage_sessions():
+            await self._load_into_memory(session_id)
 
-        # Include memory sessions
-        for session in self._sessions.values():
-            if status is None or session.status == status:
-                sessions.append(session.get_summary_stats())
-
-        # Include storage-only sessions (not in memory)
-        storage_sessions = await self._list_storage_sessions()
-        for session_id in storage_sessions:
-            if session_id not in self._sessions:
-                session = await self._load_session_from_storage(session_id)
-                if session and (status is None or session.status == status):
-                    sessions.append(session.get_summary_stats())
+        sessions = list(self._sessions.values()) if status is None else self._sessions_with_status(status)
 
         # Sort by creation time (newest first)
-        sessions.sort(key=lambda x: x['created_at'], reverse=True)
+        sessions.sort(key=lambda session: session.created_at, reverse=True)
 
-        # Apply pagination
-        return sessions[offset:offset + limit]
+        # Apply pagination before building the summaries
+        return [session.get_summary_stats() for session in sessions[offset:offset + limit]]
 
     async def get_active_sessions(self) -> List[ConversationSession]:
         """Get all active sessions.
@@ -276,22 +283,48 @@ class SessionManager:
         Returns:
             List of active ConversationSession objects
         """
-        active_sessions = []
-
-        # Check memory sessions
-        for session in self._sessions.values():
-            if session.status == SessionStatus.ACTIVE:
-                active_sessions.append(session)
+        # Bring any storage-only sessions into memory, then serve from memory
+        for session_id in await self._unloaded_storage_sessions():
+            await self._load_into_memory(session_id)
+
+        return self._sessions_with_status(SessionStatus.ACTIVE)
+
+    def _index_status(self, session_id: str, status: SessionStatus) -> None:
+        """Record whether ``session_id`` is active in the status index."""
+        if SessionStatus(status) == SessionStatus.ACTIVE:
+            self._active_session_ids.add(session_id)
+        else:
+            self._active_session_ids.discard(session_id)
+
+    def _unindex_status(self, session_id: str) -> None:
+        """Drop ``session_id`` from the status index."""
+        self._active_session_ids.discard(session_id)
+
+    def _sessions_with_status(self, status: SessionStatus) -> List[ConversationSession]:
+        """Get in-memory sessions currently in ``status``.
+
+        Active sessions are looked up through the status index and re-checked,
+        as callers may transition a session in place before calling
+        update_session. Any other status is matched by scanning every session,
+        since a direct status assignment can move a session between statuses
+        without the index seeing it. transition_to never leaves a terminal
+        status, so only a session assigned back to active directly is missed,
+        until update_session is called for it. Index entries with no cached
+        session are skipped.
 
-        # Check storage sessions not in memory
-        storage_sessions = await self._list_storage_sessions()
-        for session_id in storage_sessions:
-            if session_id not in self._sessions:
-                session = await self._load_session_from_storage(session_id)
-                if session and session.status == SessionStatus.ACTIVE:
-                    active_sessions.append(session)
+        Args:
+            status: Status to match
 
-        return active_sessions
+        Returns:
+            Matching sessions
+        """
+        status = SessionStatus(status)
+        candidates: Iterable[Optional[ConversationSession]]
+        if status == SessionStatus.ACTIVE:
+            candidates = map(self._sessions.get, self._active_session_ids)
+        else:
+            candidates = self._sessions.values()
+        return [session for session in candidates if session is not None and session.status == status]
 
     async def cleanup_expired_sessions(self) -> int:
         """Clean up expired sessions.
@@ -303,9 +336,8 @@ class SessionManager:
         cutoff_time = datetime.now(timezone.utc) - timedelta(hours=self.session_timeout_hours)
 
         # Get all sessions
-        all_sessions = list(self._sessions.keys())
-        storage_sessions = await self._list_storage_sessions()
-        all_session_ids = set(all_sessions + storage_sessions)
+        all_session_ids = set(self._sessions)
+        all_session_ids.update(await self._unloaded_storage_sessions())
 
         for session_id in all_session_ids:
             try:
@@ -361,114 +393,273 @@ class SessionManager:
 
         return export_data
 
+    def _log_path(self, session_id: str) -> Path:
+        """Path of the append-only JSONL log for a session."""
+        return self.storage_path / f"{session_id}.jsonl"
+
+    def _legacy_path(self, session_id: str) -> Path:
+        """Path of the single-document JSON snapshot used by older versions."""
+        return self.storage_path / f"{session_id}.json"
+
     async def _save_session_to_storage(
         self,
         session: ConversationSession,
-        orchestration_state: Optional[OrchestrationState] = None
+        orchestration_state: Optional[OrchestrationState] = None,
+        compact: bool = False
     ) -> None:
         """Save session to persistent storage.
 
+        Sessions are stored as a JSONL log of ``turn`` records, each appended
+        once, a ``session`` record holding every other field, and
+        ``session_update`` records holding only the fields that changed since
+        the previous save. A save therefore costs the size of what changed,
+        not of the session. The log is rewritten when it does not exist yet,
+        when the turn history no longer extends what was persisted, or when
+        ``compact`` is set.
+
+        Callers must hold the session's lock, as the bookkeeping of what has
+        already been persisted is read and updated across the write.
+
         Args:
             session: Session to save
             orchestration_state: Orchestration state to save
+            compact: Rewrite the log with a single ``session`` record
         """
-        session_file = self.storage_path / f"{session.session_id}.json"
+        session_id = session.session_id
+        turns = session.turn_history
+        persisted = self._persisted_turns.get(session_id)
+        rewrite = compact or persisted is None or persisted > len(turns)
+
+        state = {
+            "session": session.model_dump(mode="json", exclude={"turn_history"}),
+            "orchestration_state": orchestration_state.model_dump(mode="json") if orchestration_state else None,
+        }
+        records = [
+            {"type": "turn", "turn": turn}
+            for turn in (turns if rewrite else turns[persisted:])
+        ]
+        saved_at = datetime.now(timezone.utc).isoformat()
+        if rewrite:
+            records.append({"type": "session", **state, "saved_at": saved_at, "version": _STORAGE_VERSION})
+        else:
+            update = self._diff_persisted_state(self._persisted_state[session_id], state)
+            if update:
+                records.append({"type": "session_update", **update, "saved_at": saved_at})
+
+        if records:
+            # Encoded by pydantic-core, which serializes turn models directly
+            payload = b"".join(to_json(record) + b"\n" for record in records)
+            await asyncio.to_thread(self._write_log_file, self._log_path(session_id), payload, rewrite)
+        self._persisted_turns[session_id] = len(turns)
+        self._persisted_state[session_id] = state
+
+        if rewrite:
+            # The log now supersedes any snapshot written by older versions
+            legacy_file = self._legacy_path(session_id)
+            if legacy_file.exists():
+                legacy_file.unlink()
 
-        data = {
-            "session": session.model_dump(),
-            "orchestration_state": orchestration_state.model_dump() if orchestration_state else None,
-            "saved_at": datetime.now(timezone.utc).isoformat(),
-            "version": "1.0"
+    @staticmethod
+    def _write_log_file(path: Path, payload: bytes, rewrite: bool) -> None:
+        """Write all of a save's records in one open/write/close cycle.
+
+        Run in a worker thread as a single call, rather than through aiofiles,
+        which hands the open, the write and the close to the thread pool
+        separately. A rewrite goes to a sibling temporary file that replaces
+        the log only once it is on disk, so a crash mid-write leaves the
+        previous log intact.
+        """
+        if not rewrite:
+            with open(path, 'ab') as f:
+                f.write(payload)
+            return
+
+        temp_path = path.with_name(path.name + ".tmp")
+        with open(temp_path, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+
+    @staticmethod
+    def _diff_persisted_state(previous: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+        """Compute the ``session_update`` payload between two persisted states.
+
+        Args:
+            previous: State as last written to the log
+            current: State about to be saved
+
+        Returns:
+            Changed session fields under ``session`` and, if it changed, the
+            new ``orchestration_state``; empty when nothing changed
+        """
+        update: Dict[str, Any] = {}
+        old_fields = previous["session"]
+        changed = {
+            key: value for key, value in current["session"].items()
+            if key not in old_fields or old_fields[key] != value
         }
+        if changed:
+            update["session"] = changed
+        if current["orchestration_state"] != previous["orchestration_state"]:
+            update["orchestration_state"] = current["orchestration_state"]
+        return update
 
-        async with aiofiles.open(session_file, 'w') as f:
-            await f.write(json.dumps(data, indent=2, default=str))
+    async def _read_session_data(self, session_id: str) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """Read the stored form of a session.
 
-    async def _load_session_from_storage(self, session_id: str) -> Optional[ConversationSession]:
-        """Load session from persistent storage.
+        Folds the session's JSONL log into the legacy snapshot shape, with
+        ``session`` (including ``turn_history``) and ``orchestration_state``
+        keys, falling back to a legacy ``.json`` snapshot when no log exists.
 
         Args:
             session_id: Session identifier
 
         Returns:
-            ConversationSession if found, None otherwise
+            Stored session data, or None if the session is not in storage,
+            and whether the data was folded from the session's log
         """
-        session_file = self.storage_path / f"{session_id}.json"
+        log_file = self._log_path(session_id)
+        if not log_file.exists():
+            legacy_file = self._legacy_path(session_id)
+            if not legacy_file.exists():
+                return None, False
+            async with aiofiles.open(legacy_file, 'rb') as f:
+                return cast(Dict[str, Any], from_json(await f.read())), False
 
-        if not session_file.exists():
-            return None
+        data, turns = await asyncio.to_thread(self._fold_log_file, log_file)
+        if data is None:
+            return None, False
 
-        try:
-            async with aiofiles.open(session_file, 'r') as f:
-                content = await f.read()
-                data = json.loads(content)
+        data["session"]["turn_history"] = turns
+        return data, True
 
-            session_data = data.get("session")
-            if session_data:
-                return ConversationSession(**session_data)
+    def _fold_log_file(self, log_file: Path) -> Tuple[Optional[Dict[str, Any]], List[Any]]:
+        """Fold a session log into its latest ``session`` record and turns.
 
-        except Exception as e:
-            self.logger.error(f"Failed to load session {session_id}: {str(e)}")
+        The file is parsed a line at a time, so only one raw record is held
+        in memory at once. Runs in a worker thread as a single call.
 
-        return None
+        Args:
+            log_file: Path of the session's JSONL log
 
-    async def _load_orchestration_state_from_storage(self, session_id: str) -> Optional[OrchestrationState]:
-        """Load orchestration state from persistent storage.
+        Returns:
+            The ``session`` record with later updates applied (None if the log
+            has none), and the turn records in order
+        """
+        turns: List[Any] = []
+        data: Optional[Dict[str, Any]] = None
+        with open(log_file, 'rb') as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = from_json(line)
+                except ValueError:
+                    # A crash mid-append can leave a truncated final record
+                    self.logger.warning(f"Skipping unreadable record {line_number} in {log_file}")
+                    continue
+                record_type = record.get("type")
+                if record_type == "turn":
+                    turns.append(record["turn"])
+                elif record_type == "session":
+                    data = record
+                elif record_type == "session_update" and data is not None:
+                    data["session"].update(record.get("session", {}))
+                    if "orchestration_state" in record:
+                        data["orchestration_state"] = record["orchestration_state"]
+                    data["saved_at"] = record["saved_at"]
+        return data, turns
+
+    async def _load_into_memory(self, session_id: str) -> Optional[ConversationSession]:
+        """Load a stored session and its orchestration state into memory.
+
+        Both come from a single read of the session's storage. Entries already
+        in memory are kept, since they may be newer than what was persisted.
+        What the log holds is recorded as persisted under the session's lock,
+        and only for sessions no save has recorded yet.
 
         Args:
             session_id: Session identifier
 
         Returns:
-            OrchestrationState if found, None otherwise
+            The cached ConversationSession if found, None otherwise
         """
-        session_file = self.storage_path / f"{session_id}.json"
+        try:
+            data, from_log = await self._read_session_data(session_id)
+            if data is None:
+                return None
+            session_data = data.get("session")
+            if not session_data:
+                return None
+            session = ConversationSession(**session_data)
 
-        if not session_file.exists():
+        except Exception as e:
+            self.logger.error(f"Failed to load session {session_id}: {str(e)}")
             return None
 
-        try:
-            async with aiofiles.open(session_file, 'r') as f:
-                content = await f.read()
-                data = json.loads(content)
+        async with self._session_locks.setdefault(session_id, asyncio.Lock()):
+            if session_id not in self._sessions:
+                self._sessions[session_id] = session
+                self._index_status(session_id, session.status)
+            session = self._sessions[session_id]
 
             state_data = data.get("orchestration_state")
-            if state_data:
-                return OrchestrationState(**state_data)
-
-        except Exception as e:
-            self.logger.error(f"Failed to load orchestration state {session_id}: {str(e)}")
+            if state_data and session_id not in self._orchestration_states:
+                try:
+                    self._orchestration_states[session_id] = OrchestrationState(**state_data)
+                except Exception as e:
+                    self.logger.error(f"Failed to load orchestration state {session_id}: {str(e)}")
+
+            # A save that ran while the log was being read has already
+            # recorded newer bookkeeping, which must not be rolled back
+            if from_log and session_id not in self._persisted_turns:
+                self._persisted_turns[session_id] = len(session_data["turn_history"])
+                self._persisted_state[session_id] = {
+                    "session": {
+                        key: value for key, value in session_data.items() if key != "turn_history"
+                    },
+                    "orchestration_state": state_data,
+                }
 
-        return None
+        return session
 
     async def _load_sessions_from_storage(self) -> None:
         """Load existing sessions from storage into memory."""
         if not self.storage_path.exists():
             return
 
-        session_files = list(self.storage_path.glob("*.json"))
-        loaded_count = 0
-
-        for session_file in session_files:
-            try:
-                session_id = session_file.stem
-                session = await self._load_session_from_storage(session_id)
-                orchestration_state = await self._load_orchestration_state_from_storage(session_id)
-
-                if session:
-                    self._sessions[session_id] = session
-                    self._session_locks[session_id] = asyncio.Lock()
+        # Sessions are independent, so read them concurrently, bounded to
+        # keep open file handles in check
+        semaphore = asyncio.Semaphore(_RECOVERY_CONCURRENCY)
 
-                    if orchestration_state:
-                        self._orchestration_states[session_id] = orchestration_state
+        async def load(session_id: str) -> Optional[ConversationSession]:
+            async with semaphore:
+                return await self._load_into_memory(session_id)
 
-                    loaded_count += 1
+        sessions = await asyncio.gather(
+            *(load(session_id) for session_id in await self._unloaded_storage_sessions())
+        )
+        loaded_count = sum(1 for session in sessions if session)
 
-            except Exception as e:
-                self.logger.error(f"Failed to load session from {session_file}: {str(e)}")
+        self._storage_loaded = True
 
         if loaded_count > 0:
             self.logger.info(f"Loaded {loaded_count} sessions from storage")
 
+    async def _unloaded_storage_sessions(self) -> List[str]:
+        """List stored session IDs that are not in memory.
+
+        Returns:
+            Session IDs to load, or none once storage has been loaded
+        """
+        if self._storage_loaded:
+            return []
+        return [
+            session_id for session_id in await self._list_storage_sessions()
+            if session_id not in self._sessions
+        ]
+
     async def _list_storage_sessions(self) -> List[str]:
         """List session IDs available in storage.
 
@@ -478,8 +669,16 @@ class SessionManager:
         if not self.storage_path.exists():
             return []
 
-        session_files = list(self.storage_path.glob("*.json"))
-        return [f.stem for f in session_files]
+        # A session may briefly have both a log and a legacy snapshot. scandir
+        # yields names and entry types without building a Path or calling stat
+        # per file.
+        session_ids = set()
+        with os.scandir(self.storage_path) as entries:
+            for entry in entries:
+                session_id, suffix = os.path.splitext(entry.name)
+                if suffix in (".jsonl", ".json") and entry.is_file():
+                    session_ids.add(session_id)
+        return list(session_ids)
 
     async def _load_audit_records(self, session_id: str) -> List[AuditRecord]:
         """Load audit records for a session.
@@ -517,11 +716,12 @@ class SessionManager:
             except asyncio.CancelledError:
                 pass
 
-        # Save all sessions to storage
-        for session_id, session in self._sessions.items():
+        # Save all sessions to storage, compacting their logs
+        for session_id, session in list(self._sessions.items()):
             orchestration_state = self._orchestration_states.get(session_id)
             try:
-                await self._save_session_to_storage(session, orchestration_state)
+                async with self._session_locks.setdefault(session_id, asyncio.Lock()):
+                    await self._save_session_to_storage(session, orchestration_state, compact=True)
             except Exception as e:
                 self.logger.error(f"Failed to save session {session_id} during shutdown: {str(e)}")
 
@@ -535,7 +735,7 @@ class SessionManager:
         """
         status_counts = {}
         for session in self._sessions.values():
-            status = session.status.value
+            status = SessionStatus(session.status).value
             status_counts[status] = status_counts.get(status, 0) + 1
 
         return {
@@ -0,0 +1,15 @@
+"""Shared fixtures for the whole test suite."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_session_storage(tmp_path, monkeypatch):
+    """Run each test from a temporary directory with a temporary home.
+
+    SessionManager stores sessions under ./data/sessions by default and
+    TABConfig under ~/.tab/sessions, so tests that keep the defaults write
+    their session logs here instead of the working tree or the real home.
+    """
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("HOME", str(tmp_path))
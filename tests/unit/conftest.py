@@ -0,0 +1,27 @@
+"""Shared fixtures for unit tests."""
+
+import pytest
+
+from src.tab.models.conversation_session import ConversationSession
+from src.tab.models.turn_message import TurnMessage, MessageRole
+
+
+@pytest.fixture(scope="session")
+def valid_session():
+    """Canonical conversation session, validated once per test session.
+
+    Shared across tests; treat as read-only.
+    """
+    return ConversationSession(participants=["claude_code", "codex_cli"], topic="test")
+
+
+@pytest.fixture(scope="session")
+def valid_turn(valid_session):
+    """Canonical turn message for ``valid_session``; treat as read-only."""
+    return TurnMessage(
+        session_id=valid_session.session_id,
+        from_agent="claude_code",
+        to_agent="codex_cli",
+        role=MessageRole.ASSISTANT,
+        content="test message"
+    )
@@ -6,12 +6,14 @@ to ensure <2 second per turn requirement is met.
 """
 
 import asyncio
+import random
+import threading
 import time
 import psutil
 import pytest
-from unittest.mock import Mock, AsyncMock
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from contextlib import asynccontextmanager
+from itertools import cycle, islice
 
 from tab.services.conversation_orchestrator import ConversationOrchestrator
 from tab.services.session_manager import SessionManager
@@ -22,49 +24,156 @@ from tab.models.agent_adapter import AgentAdapter, AgentType, AgentStatus
 from tab.models.policy_configuration import PolicyConfiguration, PermissionMode
 
 
+NS_PER_MS = 1_000_000
+BYTES_PER_MB = 1024 * 1024
+
+_PROC = psutil.Process()
+
+
+class Reservoir:
+    """Bounded uniform sample of a stream with exact running statistics.
+
+    Count, sum, min, max and the Welford mean/variance cover every recorded
+    value; only percentiles are computed from the (at most ``max_size``)
+    retained samples.
+    """
+
+    def __init__(self, max_size: int = 500):
+        self.max_size = max_size
+        self.samples: List[float] = []
+        self.count = 0
+        self.total = 0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.mean = 0.0
+        self._m2 = 0.0
+        self._rng = random.Random()
+
+    def append(self, value: float) -> None:
+        """Record a value, keeping it in the sample with probability max_size/count."""
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+        if len(self.samples) < self.max_size:
+            self.samples.append(value)
+        else:
+            index = self._rng.randrange(self.count)
+            if index < self.max_size:
+                self.samples[index] = value
+
+    @property
+    def variance(self) -> float:
+        """Population variance of every recorded value."""
+        return self._m2 / self.count if self.count else 0.0
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+    def __getitem__(self, index: int) -> float:
+        return self.samples[index]
+
+    def __iter__(self):
+        return iter(self.samples)
+
+
 class PerformanceMetrics:
     """Collects and analyzes performance metrics."""
 
-    def __init__(self):
-        self.turn_latencies: List[float] = []
-        self.memory_usage: List[float] = []
-        self.cpu_usage: List[float] = []
+    def __init__(self, max_samples: int = 500):
+        self.turn_latencies = Reservoir(max_samples)  # nanoseconds
+        self.memory_usage = Reservoir(max_samples)  # RSS bytes
+        self.cpu_usage = Reservoir(max_samples)
         self.concurrent_sessions = 0
         self.errors: List[str] = []
+        self._sample_lock = threading.Lock()
+        self._sampler_stop = threading.Event()
+        self._sampler: Optional[threading.Thread] = None
 
-    def record_turn_latency(self, latency_ms: float) -> None:
-        """Record turn processing latency."""
-        self.turn_latencies.append(latency_ms)
+    def record_turn_latency(self, latency_ns: int) -> None:
+        """Record turn processing latency in integer nanoseconds."""
+        self.turn_latencies.append(latency_ns)
 
     def record_system_metrics(self) -> None:
-        """Record current system resource usage."""
-        process = psutil.Process()
-        self.memory_usage.append(process.memory_info().rss / 1024 / 1024)  # MB
-        self.cpu_usage.append(process.cpu_percent())
+        """Record current system resource usage.
+
+        Called from the sampler thread; the psutil reads happen under the
+        lock too, since cpu_percent() keeps per-process state between calls.
+        """
+        with self._sample_lock:
+            self.memory_usage.append(_PROC.memory_info().rss)
+            self.cpu_usage.append(_PROC.cpu_percent(interval=None))
+
+    def start_sampler(self, interval: float = 0.1) -> None:
+        """Sample system metrics on a background thread, off the turn hot path."""
+        if self._sampler is not None:
+            return
+
+        def _run() -> None:
+            while not self._sampler_stop.wait(interval):
+                self.record_system_metrics()
+
+        # cpu_percent() reports 0.0 on its first call; prime the cached
+        # process so every recorded sample is a real delta
+        _PROC.cpu_percent(interval=None)
+        self._sampler_stop.clear()
+        self._sampler = threading.Thread(target=_run, name="perf-sampler", daemon=True)
+        self._sampler.start()
+
+    def stop_sampler(self) -> None:
+        """Stop the background sampler thread, if running."""
+        if self._sampler is None:
+            return
+        self._sampler_stop.set()
+        self._sampler.join()
+        self._sampler = None
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get performance statistics."""
-        if not self.turn_latencies:
+        latencies = self.turn_latencies
+        if not latencies.count:
             return {"error": "No performance data collected"}
 
+        # The sampler thread may be appending concurrently; read a consistent
+        # snapshot of the system metrics under its lock
+        with self._sample_lock:
+            memory_count, memory_total, memory_max = (
+                self.memory_usage.count, self.memory_usage.total, self.memory_usage.max
+            )
+            cpu_count, cpu_total, cpu_max = self.cpu_usage.count, self.cpu_usage.total, self.cpu_usage.max
+
+        # Sort the bounded sample once and index both percentiles from it
+        ordered = sorted(latencies.samples)
+        last = len(ordered) - 1
+
+        # Latencies (ns) and memory (bytes) are kept as integers; convert
+        # only when reporting
         return {
             "turn_latency": {
-                "avg_ms": sum(self.turn_latencies) / len(self.turn_latencies),
-                "max_ms": max(self.turn_latencies),
-                "min_ms": min(self.turn_latencies),
-                "p95_ms": self._percentile(self.turn_latencies, 95),
-                "p99_ms": self._percentile(self.turn_latencies, 99),
-                "count": len(self.turn_latencies)
+                "avg_ms": latencies.total / latencies.count / NS_PER_MS,
+                "max_ms": latencies.max / NS_PER_MS,
+                "min_ms": latencies.min / NS_PER_MS,
+                "stddev_ms": latencies.variance ** 0.5 / NS_PER_MS,
+                "p95_ms": ordered[min(int(0.95 * len(ordered)), last)] / NS_PER_MS,
+                "p99_ms": ordered[min(int(0.99 * len(ordered)), last)] / NS_PER_MS,
+                "count": latencies.count
             },
             "memory_usage": {
-                "avg_mb": sum(self.memory_usage) / len(self.memory_usage) if self.memory_usage else 0,
-                "max_mb": max(self.memory_usage) if self.memory_usage else 0,
-                "samples": len(self.memory_usage)
+                "avg_mb": memory_total / memory_count / BYTES_PER_MB if memory_count else 0,
+                "max_mb": memory_max / BYTES_PER_MB if memory_count else 0,
+                "samples": memory_count
             },
             "cpu_usage": {
-                "avg_percent": sum(self.cpu_usage) / len(self.cpu_usage) if self.cpu_usage else 0,
-                "max_percent": max(self.cpu_usage) if self.cpu_usage else 0,
-                "samples": len(self.cpu_usage)
+                "avg_percent": cpu_total / cpu_count if cpu_count else 0,
+                "max_percent": cpu_max if cpu_count else 0,
+                "samples": cpu_count
             },
             "errors": {
                 "count": len(self.errors),
@@ -72,28 +181,20 @@ class PerformanceMetrics:
             }
         }
 
-    def _percentile(self, data: List[float], percentile: float) -> float:
-        """Calculate percentile of data."""
-        sorted_data = sorted(data)
-        index = int((percentile / 100) * len(sorted_data))
-        return sorted_data[min(index, len(sorted_data) - 1)]
-
 
 @asynccontextmanager
 async def performance_monitor(metrics: PerformanceMetrics):
-    """Context manager for monitoring performance during tests."""
-    start_time = time.time()
-    start_memory = psutil.Process().memory_info().rss / 1024 / 1024  # MB
+    """Context manager for monitoring turn latency during tests.
+
+    System metrics are collected separately via ``PerformanceMetrics.start_sampler``
+    so psutil calls do not fall inside the measured interval.
+    """
+    start_ns = time.perf_counter_ns()
 
     try:
         yield
     finally:
-        end_time = time.time()
-        end_memory = psutil.Process().memory_info().rss / 1024 / 1024  # MB
-
-        latency_ms = (end_time - start_time) * 1000
-        metrics.record_turn_latency(latency_ms)
-        metrics.record_system_metrics()
+        metrics.record_turn_latency(time.perf_counter_ns() - start_ns)
 
 
 class MockAgentAdapter:
@@ -102,19 +203,27 @@ class MockAgentAdapter:
     def __init__(self, agent_id: str, latency_ms: float = 500):
         self.agent_id = agent_id
         self.latency_ms = latency_ms
+        self._latency_s = latency_ms / 1000.0
         self.call_count = 0
 
     async def process_request(self, content: str, context: Dict[str, Any]) -> Dict[str, Any]:
-        """Mock agent request processing with configurable latency."""
+        """Mock agent request processing with configurable latency.
+
+        A shared instance can answer as different agents by passing
+        ``context["agent_id"]``.
+        """
         self.call_count += 1
+        agent_id = context.get("agent_id", self.agent_id)
 
-        # Simulate processing time
-        await asyncio.sleep(self.latency_ms / 1000)
+        # Simulate processing time; latency_ms=0 skips the event-loop round trip
+        if self._latency_s:
+            await asyncio.sleep(self._latency_s)
 
+        snippet = content if len(content) <= 50 else content[:50]
         return {
             "status": "completed",
             "response": {
-                "content": f"Mock response from {self.agent_id}: {content[:50]}...",
+                "content": f"Mock response from {agent_id}: {snippet}...",
                 "reasoning": "Mock reasoning",
                 "confidence": 0.8
             },
@@ -126,6 +235,20 @@ class MockAgentAdapter:
         }
 
 
+class _StubSessionManager:
+    """Inert session manager; the latency tests never touch persistence."""
+
+
+class _StubPolicyEnforcer:
+    """Policy enforcer stub that approves every request."""
+
+    async def validate_request(self, *args, **kwargs) -> bool:
+        return True
+
+    def get_constraints(self, *args, **kwargs) -> Dict[str, Any]:
+        return {}
+
+
 class TestTurnLatencyPerformance:
     """Test conversation turn latency performance."""
 
@@ -137,16 +260,9 @@ class TestTurnLatencyPerformance:
     @pytest.fixture
     def mock_orchestrator(self):
         """Create mock orchestrator for performance testing."""
-        session_manager = Mock()
-        policy_enforcer = Mock()
-
-        # Mock successful policy validation
-        policy_enforcer.validate_request = AsyncMock(return_value=True)
-        policy_enforcer.get_constraints = Mock(return_value={})
-
         orchestrator = ConversationOrchestrator(
-            session_manager=session_manager,
-            policy_enforcer=policy_enforcer,
+            session_manager=_StubSessionManager(),
+            policy_enforcer=_StubPolicyEnforcer(),
             agent_configs={}
         )
 
@@ -205,12 +321,15 @@ class TestTurnLatencyPerformance:
             topic="Multi-turn performance test"
         )
 
-        for turn in range(conversation_turns):
-            async with performance_monitor(performance_metrics):
-                # Alternate between agents
-                agent_id = "fast_agent" if turn % 2 == 0 else "medium_agent"
-                agent = mock_orchestrator._agent_adapters[agent_id]
+        # Alternate between agents, resolved once up front
+        adapters = mock_orchestrator._agent_adapters
+        agent_sequence = islice(
+            cycle([adapters["fast_agent"], adapters["medium_agent"]]),
+            conversation_turns
+        )
 
+        for turn, agent in enumerate(agent_sequence):
+            async with performance_monitor(performance_metrics):
                 await agent.process_request(
                     content=f"Turn {turn + 1} content for multi-turn conversation",
                     context={
@@ -222,7 +341,7 @@ class TestTurnLatencyPerformance:
         stats = performance_metrics.get_statistics()
 
         # Validate multi-turn performance
-        assert len(stats["turn_latency"]["count"]) == conversation_turns, \
+        assert stats["turn_latency"]["count"] == conversation_turns, \
             f"Expected {conversation_turns} turns, got {stats['turn_latency']['count']}"
 
         assert stats["turn_latency"]["avg_ms"] < target_avg_latency_ms, \
@@ -270,33 +389,33 @@ class TestResourceUsagePerformance:
 
     @pytest.fixture
     def performance_metrics(self):
-        """Create performance metrics collector."""
-        return PerformanceMetrics()
+        """Create performance metrics collector with background system sampling."""
+        metrics = PerformanceMetrics()
+        metrics.start_sampler()
+        yield metrics
+        metrics.stop_sampler()
 
     @pytest.mark.asyncio
     async def test_memory_usage_stability(self, performance_metrics):
         """Test that memory usage remains stable over time."""
         max_memory_growth_mb = 50  # Maximum allowed memory growth
         test_duration_seconds = 30
-        sample_interval_seconds = 1
 
-        start_memory = psutil.Process().memory_info().rss / 1024 / 1024  # MB
+        start_memory = _PROC.memory_info().rss
+        agent = MockAgentAdapter("memory-test-agent", latency_ms=100)
 
-        # Simulate continuous operation
+        # Simulate continuous operation; the fixture's background sampler
+        # records memory every 100ms while the agent works back to back
         start_time = time.time()
         while time.time() - start_time < test_duration_seconds:
-            # Simulate agent operations
-            agent = MockAgentAdapter("memory-test-agent", latency_ms=100)
-            await agent.process_request(
-                content="Memory stability test",
-                context={"test": "memory"}
-            )
-
-            performance_metrics.record_system_metrics()
-            await asyncio.sleep(sample_interval_seconds)
+            async with performance_monitor(performance_metrics):
+                await agent.process_request(
+                    content="Memory stability test",
+                    context={"test": "memory"}
+                )
 
-        end_memory = psutil.Process().memory_info().rss / 1024 / 1024  # MB
-        memory_growth = end_memory - start_memory
+        end_memory = _PROC.memory_info().rss
+        memory_growth = (end_memory - start_memory) / BYTES_PER_MB
 
         stats = performance_metrics.get_statistics()
 
@@ -311,21 +430,16 @@ class TestResourceUsagePerformance:
         """Test CPU usage efficiency during operations."""
         max_sustained_cpu_percent = 80  # Maximum sustained CPU usage
         test_operations = 20
+        agent = MockAgentAdapter("cpu-test-agent", latency_ms=200)
 
+        # CPU samples come only from the fixture's background sampler
         for i in range(test_operations):
-            start_cpu = psutil.Process().cpu_percent()
-
             # Simulate CPU-intensive agent operation
-            agent = MockAgentAdapter(f"cpu-test-agent-{i}", latency_ms=200)
-            await agent.process_request(
-                content=f"CPU efficiency test {i}",
-                context={"test": "cpu"}
-            )
-
-            performance_metrics.record_system_metrics()
-
-            # Small delay to allow CPU measurement
-            await asyncio.sleep(0.1)
+            async with performance_monitor(performance_metrics):
+                await agent.process_request(
+                    content=f"CPU efficiency test {i}",
+                    context={"test": "cpu", "agent_id": f"cpu-test-agent-{i}"}
+                )
 
         stats = performance_metrics.get_statistics()
 
@@ -340,20 +454,20 @@ class TestResourceUsagePerformance:
         max_concurrent_sessions = 10
         max_latency_degradation_percent = 50  # Max 50% latency increase
 
-        # Baseline single session performance
+        # Baseline single session performance, measured separately so the
+        # concurrent phase below starts from an empty collector
+        baseline_metrics = PerformanceMetrics()
         baseline_agent = MockAgentAdapter("baseline-agent", latency_ms=300)
 
-        async with performance_monitor(performance_metrics):
+        async with performance_monitor(baseline_metrics):
             await baseline_agent.process_request(
                 content="Baseline performance test",
                 context={"test": "baseline"}
             )
 
-        baseline_latency = performance_metrics.turn_latencies[0]
+        baseline_latency = baseline_metrics.get_statistics()["turn_latency"]["avg_ms"]
 
         # Test with multiple concurrent sessions
-        performance_metrics.turn_latencies.clear()  # Reset for concurrent test
-
         async def concurrent_session(session_id: str):
             """Simulate a concurrent session."""
             agent = MockAgentAdapter(f"concurrent-agent-{session_id}", latency_ms=300)
@@ -397,21 +511,35 @@ class TestStressAndLoadPerformance:
         operations_per_second = 5
         target_max_latency_ms = 3000  # Higher threshold for sustained load
 
-        start_time = time.time()
-        operation_count = 0
+        agent = MockAgentAdapter("load-agent", latency_ms=400)
 
-        while time.time() - start_time < load_duration_seconds:
-            async with performance_monitor(metrics):
-                agent = MockAgentAdapter(f"load-agent-{operation_count}", latency_ms=400)
-                await agent.process_request(
-                    content=f"Sustained load test operation {operation_count}",
-                    context={"operation": operation_count}
-                )
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        end_time = start_time + load_duration_seconds
+        n_workers = operations_per_second
 
-            operation_count += 1
+        async def worker(worker_id: int) -> int:
+            """Run every n_workers-th scheduled operation until the deadline."""
+            completed = 0
+            op_id = worker_id
+            while True:
+                # Operation op_id is due at start + op_id / rate
+                scheduled = start_time + op_id / operations_per_second
+                await asyncio.sleep(max(0.0, scheduled - loop.time()))
+                if loop.time() >= end_time:
+                    return completed
 
-            # Control operation rate
-            await asyncio.sleep(1.0 / operations_per_second)
+                async with performance_monitor(metrics):
+                    await agent.process_request(
+                        content=f"Sustained load test operation {op_id}",
+                        context={"operation": op_id, "agent_id": f"load-agent-{op_id}"}
+                    )
+                completed += 1
+                op_id += n_workers
+
+        operation_count = sum(
+            await asyncio.gather(*(worker(i) for i in range(n_workers)))
+        )
 
         stats = metrics.get_statistics()
 
@@ -434,12 +562,15 @@ class TestStressAndLoadPerformance:
             def __init__(self, *args, **kwargs):
                 super().__init__(*args, **kwargs)
                 self.error_probability = error_rate
+                self._error = Exception(f"Simulated error from {self.agent_id}")
 
             async def process_request(self, content: str, context: Dict[str, Any]) -> Dict[str, Any]:
                 if self.call_count < total_operations * self.error_probability:
-                    # Simulate error
+                    # Simulate error; count the failed call so the agent recovers
+                    self.call_count += 1
                     await asyncio.sleep(0.1)  # Error handling delay
-                    raise Exception(f"Simulated error from {self.agent_id}")
+                    # Drop the previous traceback so re-raising doesn't chain frames
+                    raise self._error.with_traceback(None)
 
                 return await super().process_request(content, context)
 
@@ -489,15 +620,15 @@ class TestPerformanceRegression:
             "expected_avg_latency_ms": 800
         }
 
+        agent = MockAgentAdapter("baseline",
+                               latency_ms=baseline_config["agent_latency_ms"])
+
         async def baseline_operation(op_id: int):
             """Baseline operation for regression testing."""
-            agent = MockAgentAdapter(f"baseline-{op_id}",
-                                   latency_ms=baseline_config["agent_latency_ms"])
-
             async with performance_monitor(metrics):
                 await agent.process_request(
                     content=f"Baseline regression test {op_id}",
-                    context={"operation_id": op_id}
+                    context={"operation_id": op_id, "agent_id": f"baseline-{op_id}"}
                 )
 
         # Execute baseline operations
@@ -506,7 +637,11 @@ class TestPerformanceRegression:
             for i in range(baseline_config["operations"])
         ]
 
-        await asyncio.gather(*tasks)
+        metrics.start_sampler()
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            metrics.stop_sampler()
 
         stats = metrics.get_statistics()
 
@@ -5,6 +5,7 @@ Tests the PolicyEnforcer service to ensure proper policy enforcement,
 validation rules, and permission boundary checks.
 """
 
+import fnmatch
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 from datetime import datetime
@@ -12,7 +13,7 @@ from typing import Dict, Any
 
 from tab.services.policy_enforcer import PolicyEnforcer
 from tab.models.policy_configuration import PolicyConfiguration
-from tab.models.turn_message import TurnMessage
+from tab.models.turn_message import AttachmentType, TurnMessage
 from tab.models.agent_adapter import AgentAdapter
 
 
@@ -411,4 +412,423 @@ class TestPolicyEnforcement:
         )
 
         assert result["approval_required"] is True
-        assert "write" in result["approval_reason"]
\ No newline at end of file
+        assert "write" in result["approval_reason"]
+
+
+@pytest.fixture
+def rule_policy_enforcer():
+    """PolicyEnforcer loaded with a policy using the PolicyConfiguration schema."""
+    return PolicyEnforcer({
+        "rules_policy": {
+            "policy_id": "rules_policy",
+            "name": "Rules Policy",
+            "description": "Policy exercising compiled rule indexes",
+            "permission_mode": "prompt",
+            "allowed_tools": ["read", "write", "search"],
+            "disallowed_tools": ["delete", "system"],
+            "approval_required": ["write"],
+            "file_access_rules": {
+                "allowed_patterns": ["/workspace/*", "*.md"],
+                "disallowed_patterns": ["/workspace/secrets/*", "**/*.key", "/etc/*"],
+                "readonly_paths": ["/workspace/vendor", "/usr"]
+            }
+        }
+    })
+
+
+class TestFileAccessRuleIndex:
+    """Test file access validation through the compiled rule index."""
+
+    def test_allowed_pattern(self, rule_policy_enforcer):
+        result = rule_policy_enforcer.validate_file_access("rules_policy", "/workspace/src/app.py", "read")
+
+        assert result["allowed"] is True
+
+    def test_disallowed_pattern_takes_precedence(self, rule_policy_enforcer):
+        result = rule_policy_enforcer.validate_file_access("rules_policy", "/workspace/secrets/token", "read")
+
+        assert result["allowed"] is False
+        assert "/workspace/secrets/*" in result["reason"]
+
+    def test_disallowed_pattern_without_literal_prefix(self, rule_policy_enforcer):
+        result = rule_policy_enforcer.validate_file_access("rules_policy", "/workspace/certs/server.key", "read")
+
+        assert result["allowed"] is False
+        assert "**/*.key" in result["reason"]
+
+    def test_readonly_path_blocks_writes_only(self, rule_policy_enforcer):
+        read = rule_policy_enforcer.validate_file_access("rules_policy", "/workspace/vendor/lib.py", "read")
+        write = rule_policy_enforcer.validate_file_access("rules_policy", "/workspace/vendor/lib.py", "write")
+
+        assert read["allowed"] is True
+        assert write["allowed"] is False
+        assert "/workspace/vendor" in write["reason"]
+
+    def test_path_outside_allowed_patterns(self, rule_policy_enforcer):
+        result = rule_policy_enforcer.validate_file_access("rules_policy", "/home/user/notes.txt", "read")
+
+        assert result["allowed"] is False
+        assert "not in allowed paths" in result["reason"]
+
+    def test_policies_with_identical_rules_agree(self):
+        rules = {
+            "allowed_patterns": ["/workspace/*"],
+            "disallowed_patterns": ["/workspace/secrets/*", "/etc/*", "**/*.key"]
+        }
+        enforcer = PolicyEnforcer({
+            policy_id: {
+                "policy_id": policy_id,
+                "name": policy_id,
+                "description": "Shares file rules with its sibling",
+                "file_access_rules": rules
+            }
+            for policy_id in ("first", "second")
+        })
+
+        for path in ("/etc/passwd", "/srv/tls.key", "/workspace/app.py", "/workspace/secrets/x"):
+            assert (
+                enforcer.validate_file_access("first", path, "read")
+                == enforcer.validate_file_access("second", path, "read")
+            )
+        assert enforcer.validate_file_access("second", "/etc/passwd", "read")["allowed"] is False
+        assert enforcer.validate_file_access("second", "/srv/tls.key", "read")["allowed"] is False
+        assert enforcer.validate_file_access("second", "/workspace/app.py", "read")["allowed"] is True
+
+    def test_read_access_agrees_with_glob_matching(self, rule_policy_enforcer):
+        paths = [
+            "/workspace/", "/workspace/a/b.py", "/workspacex/a.py", "/etc/hosts",
+            "/etc", "/workspace/secrets/x", "/home/notes.md", "/home/notes.txt"
+        ]
+
+        for path in paths:
+            disallowed = any(
+                fnmatch.fnmatchcase(path, p) for p in ["/workspace/secrets/*", "**/*.key", "/etc/*"]
+            )
+            allowed = any(fnmatch.fnmatchcase(path, p) for p in ["/workspace/*", "*.md"])
+
+            result = rule_policy_enforcer.validate_file_access("rules_policy", path, "read")
+
+            assert result["allowed"] is (allowed and not disallowed), path
+
+    def test_read_access_with_partial_rule_sets(self):
+        enforcer = PolicyEnforcer({
+            "open": {"policy_id": "open", "name": "open", "description": "No file rules"},
+            "deny_only": {
+                "policy_id": "deny_only",
+                "name": "deny_only",
+                "description": "Only disallowed patterns",
+                "file_access_rules": {"disallowed_patterns": ["/etc/*"]}
+            }
+        })
+
+        denied = enforcer.validate_file_access("deny_only", "/etc/passwd", "read")
+
+        assert enforcer.validate_file_access("open", "/etc/passwd", "read")["allowed"] is True
+        assert denied["allowed"] is False
+        assert "/etc/*" in denied["reason"]
+        assert enforcer.validate_file_access("deny_only", "/srv/data.txt", "read")["allowed"] is True
+
+    def test_long_rule_paths_load(self):
+        long_path = "/workspace/" + "a" * 1500
+        enforcer = PolicyEnforcer({
+            "long_paths": {
+                "policy_id": "long_paths",
+                "name": "long_paths",
+                "description": "Rules longer than the recursion limit",
+                "file_access_rules": {
+                    "readonly_paths": [long_path],
+                    "disallowed_patterns": [long_path + "/*.key"]
+                }
+            }
+        })
+
+        write = enforcer.validate_file_access("long_paths", long_path + "/lib.py", "write")
+        read = enforcer.validate_file_access("long_paths", long_path + "/tls.key", "read")
+
+        assert "long_paths" in enforcer.list_policies()
+        assert write["allowed"] is False
+        assert long_path in write["reason"]
+        assert read["allowed"] is False
+
+
+class TestToolIndex:
+    """Test tool usage validation through the compiled tool index."""
+
+    def test_allowed_tool(self, rule_policy_enforcer):
+        assert rule_policy_enforcer.validate_tool_usage("rules_policy", "read")["allowed"] is True
+
+    def test_allow_result_is_shared_and_read_only(self, rule_policy_enforcer):
+        first = rule_policy_enforcer.validate_tool_usage("rules_policy", "read")
+        second = rule_policy_enforcer.validate_tool_usage("rules_policy", "search")
+
+        assert first is second
+        with pytest.raises(TypeError):
+            first["allowed"] = False
+
+    def test_disallowed_tool(self, rule_policy_enforcer):
+        result = rule_policy_enforcer.validate_tool_usage("rules_policy", "delete")
+
+        assert result["allowed"] is False
+        assert "explicitly disallowed" in result["reason"]
+
+    def test_unlisted_tool(self, rule_policy_enforcer):
+        result = rule_policy_enforcer.validate_tool_usage("rules_policy", "unknown_tool")
+
+        assert result["allowed"] is False
+        assert "not in allowed tools list" in result["reason"]
+
+    def test_unknown_policy(self, rule_policy_enforcer):
+        result = rule_policy_enforcer.validate_tool_usage("missing_policy", "read")
+
+        assert result["allowed"] is False
+        assert "not found" in result["reason"]
+
+
+class TestPolicyConsistencyValidation:
+    """Test structural validation of loaded policies."""
+
+    def test_valid_policy(self, rule_policy_enforcer):
+        result = rule_policy_enforcer.validate_policy("rules_policy")
+
+        assert result["valid"] is True
+        assert result["errors"] == []
+
+    def test_unknown_policy(self, rule_policy_enforcer):
+        result = rule_policy_enforcer.validate_policy("missing_policy")
+
+        assert result["valid"] is False
+        assert "Policy 'missing_policy' not found" in result["errors"]
+
+    def test_invalid_permission_mode_is_rejected_at_load(self):
+        enforcer = PolicyEnforcer({
+            "mode_policy": {
+                "policy_id": "mode_policy",
+                "name": "Mode Policy",
+                "description": "Uses a permission mode that does not exist",
+                "permission_mode": "invalid_mode"
+            }
+        })
+
+        result = enforcer.validate_policy("mode_policy")
+
+        assert result["valid"] is False
+        assert "Policy 'mode_policy' not found" in result["errors"]
+
+    def test_overlapping_tools(self):
+        enforcer = PolicyEnforcer({
+            "overlap_policy": {
+                "policy_id": "overlap_policy",
+                "name": "Overlap Policy",
+                "description": "Allows and forbids the same tool",
+                "allowed_tools": ["read", "delete"],
+                "disallowed_tools": ["delete"]
+            }
+        })
+
+        result = enforcer.validate_policy("overlap_policy")
+
+        assert result["valid"] is False
+        assert any("overlap" in error and "delete" in error for error in result["errors"])
+
+    def test_identical_policies_validate_alike(self):
+        policy_data = {
+            "name": "Shared Policy",
+            "description": "Same content under two ids",
+            "allowed_tools": ["read"]
+        }
+        enforcer = PolicyEnforcer({
+            "first": {"policy_id": "shared", **policy_data},
+            "second": {"policy_id": "shared", **policy_data}
+        })
+
+        first = enforcer.validate_policy("first")
+        second = enforcer.validate_policy("second")
+
+        assert first["valid"] is True
+        assert {**second, "policy_id": "first"} == first
+        assert second["policy_id"] == "second"
+
+    def test_edits_to_a_fetched_policy_are_not_enforced(self, rule_policy_enforcer):
+        policy = rule_policy_enforcer.get_policy("rules_policy")
+        policy.disallowed_tools.append("read")
+
+        assert "read" not in rule_policy_enforcer.get_policy("rules_policy").disallowed_tools
+        assert rule_policy_enforcer.validate_policy("rules_policy")["valid"] is True
+        assert rule_policy_enforcer.validate_tool_usage("rules_policy", "read")["allowed"] is True
+
+    def test_reload_policy_enforces_edits(self, rule_policy_enforcer):
+        assert rule_policy_enforcer.validate_policy("rules_policy")["valid"] is True
+
+        policy = rule_policy_enforcer.get_policy("rules_policy")
+        policy.disallowed_tools.append("read")
+        rule_policy_enforcer.reload_policy("rules_policy", policy)
+        policy.disallowed_tools.remove("read")
+
+        assert rule_policy_enforcer.validate_policy("rules_policy")["valid"] is False
+        assert rule_policy_enforcer.validate_tool_usage("rules_policy", "read")["allowed"] is False
+        assert rule_policy_enforcer.list_policies()["rules_policy"]["disallowed_tools_count"] == 3
+
+    def test_reload_unknown_policy(self, rule_policy_enforcer):
+        policy = rule_policy_enforcer.get_policy("rules_policy")
+
+        with pytest.raises(KeyError):
+            rule_policy_enforcer.reload_policy("missing", policy)
+
+
+class TestPolicySummaries:
+    """Test policy summaries precomputed at compile time."""
+
+    def test_list_policies(self, rule_policy_enforcer):
+        summaries = rule_policy_enforcer.list_policies()
+
+        assert summaries["rules_policy"] == {
+            "name": "Rules Policy",
+            "description": "Policy exercising compiled rule indexes",
+            "permission_mode": "prompt",
+            "allowed_tools_count": 3,
+            "disallowed_tools_count": 2
+        }
+
+    def test_list_policies_returns_copies(self, rule_policy_enforcer):
+        rule_policy_enforcer.list_policies()["rules_policy"]["name"] = "changed"
+
+        assert rule_policy_enforcer.list_policies()["rules_policy"]["name"] == "Rules Policy"
+
+
+class TestSandboxCapabilityMask:
+    """Test sandbox capability checks against the compiled capability bitmask."""
+
+    @pytest.fixture
+    def sandbox_enforcer(self):
+        def policy(policy_id, **sandbox_config):
+            return {
+                "policy_id": policy_id,
+                "name": policy_id,
+                "description": "Sandbox capability policy",
+                "sandbox_config": sandbox_config
+            }
+
+        return PolicyEnforcer({
+            "drop_net": policy("drop_net", capabilities_dropped=["CAP_NET_ADMIN", "net_raw"]),
+            "drop_all": policy("drop_all", capabilities_dropped=["ALL"]),
+            "disabled": policy("disabled", enabled=False, capabilities_dropped=["ALL"]),
+            "typo": policy("typo", capabilities_dropped=["CAP_NET_ADMNI"])
+        })
+
+    def test_required_drops_present(self, sandbox_enforcer):
+        result = sandbox_enforcer.validate_sandbox_config("drop_net", ["NET_ADMIN", "CAP_NET_RAW"])
+
+        assert result["valid"] is True
+        assert result["missing_capabilities"] == []
+
+    def test_missing_drops_reported(self, sandbox_enforcer):
+        result = sandbox_enforcer.validate_sandbox_config("drop_net", ["CAP_NET_ADMIN", "CAP_SYS_ADMIN"])
+
+        assert result["valid"] is False
+        assert result["missing_capabilities"] == ["CAP_SYS_ADMIN"]
+
+    def test_all_covers_every_capability(self, sandbox_enforcer):
+        assert sandbox_enforcer.validate_sandbox_config("drop_all", ["ALL"])["valid"] is True
+        assert sandbox_enforcer.validate_sandbox_config("drop_net", ["ALL"])["valid"] is False
+
+    def test_disabled_sandbox_drops_nothing(self, sandbox_enforcer):
+        result = sandbox_enforcer.validate_sandbox_config("disabled", ["CAP_SYS_ADMIN"])
+
+        assert result["valid"] is False
+        assert result["sandbox_enabled"] is False
+
+    def test_unknown_capability_names(self, sandbox_enforcer):
+        assert sandbox_enforcer.validate_sandbox_config("drop_all", ["CAP_BOGUS"])["valid"] is False
+        assert sandbox_enforcer.validate_policy("typo")["errors"] == [
+            "Unknown capabilities in capabilities_dropped: ['CAP_NET_ADMNI']"
+        ]
+
+
+class TestResourceLimitChecks:
+    """Test resource usage validation through precompiled limit checks."""
+
+    def test_usage_within_limits(self, rule_policy_enforcer):
+        result = rule_policy_enforcer.validate_resource_limits(
+            "rules_policy", {"execution_time_seconds": 10, "memory_mb": 128}
+        )
+
+        assert result["allowed"] is True
+
+    def test_usage_exceeding_limits(self, rule_policy_enforcer):
+        result = rule_policy_enforcer.validate_resource_limits(
+            "rules_policy", {"execution_time_seconds": 500, "memory_mb": 4096}
+        )
+
+        assert result["allowed"] is False
+        assert result["violations"] == [
+            "Execution time 500s exceeds limit 120s",
+            "Memory 4096MB exceeds limit 512MB"
+        ]
+        assert result["violation_codes"] == {"execution_time_exceeded", "memory_exceeded"}
+
+    def test_zero_cost_limit_skips_cost_check(self, rule_policy_enforcer):
+        # rules_policy keeps the default max_cost_usd of 0.0 (subscription-based)
+        result = rule_policy_enforcer.validate_resource_limits("rules_policy", {"cost_usd": 5.0})
+
+        assert result["allowed"] is True
+
+
+class TestTurnMessageEnforcement:
+    """Test turn message checks resolved against the compiled policy in one pass."""
+
+    def _turn(self, *paths):
+        turn = TurnMessage(
+            session_id="rules_session",
+            from_agent="claude_code",
+            to_agent="codex_cli",
+            role="assistant",
+            content="Reviewed the attached files"
+        )
+        for path in paths:
+            turn.add_attachment(path, AttachmentType.FILE)
+        return turn
+
+    def test_allowed_attachments(self, rule_policy_enforcer):
+        turn = self._turn("/workspace/src/app.py", "/workspace/README.md")
+
+        result = rule_policy_enforcer.enforce_turn_message_policy("rules_policy", turn)
+
+        assert result["allowed"] is True
+        assert not turn.has_violations()
+        actions = [r.action for r in rule_policy_enforcer.get_audit_records("rules_session")]
+        assert actions == ["file_access_allowed", "file_access_allowed"]
+
+    def test_denied_attachment(self, rule_policy_enforcer):
+        turn = self._turn("/workspace/src/app.py", "/workspace/secrets/token.txt")
+
+        result = rule_policy_enforcer.enforce_turn_message_policy("rules_policy", turn)
+
+        assert result["allowed"] is False
+        assert result["violations"] == [
+            "Attachment access denied: File path /workspace/secrets/token.txt "
+            "is in forbidden area /workspace/secrets/*"
+        ]
+        assert result["violation_codes"] == {"attachment_denied:/workspace/secrets/token.txt"}
+        assert turn.has_violations()
+        actions = [r.action for r in rule_policy_enforcer.get_audit_records("rules_session")]
+        assert actions == [
+            "file_access_allowed", "file_access_forbidden", "turn_message_policy_violation"
+        ]
+
+    def test_turn_addition_combines_session_and_message_checks(self, rule_policy_enforcer):
+        session = Mock(current_turn=8, max_turns=8, total_cost_usd=0.0, budget_usd=1.0)
+        turn = self._turn("/etc/passwd")
+
+        result = rule_policy_enforcer.validate_turn_addition("rules_policy", session, turn)
+
+        assert result["allowed"] is False
+        assert result["violations"][0] == "Session has reached maximum turns (8)"
+        assert result["violations"][1].startswith("Attachment access denied: File path /etc/passwd")
+        assert result["violation_codes"] == {"max_turns_reached", "attachment_denied:/etc/passwd"}
+
+    def test_unknown_policy(self, rule_policy_enforcer):
+        result = rule_policy_enforcer.enforce_turn_message_policy("missing", self._turn())
+
+        assert result["allowed"] is False
+        assert result["violations"] == ["Policy missing not found"]
+        assert "policy_not_found" in result["violation_codes"]
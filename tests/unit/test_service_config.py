@@ -299,6 +299,17 @@ class TestCreateDefaultServiceContainerConfig:
         assert config.circuit_breaker_threshold >= 1
         assert config.health_check_interval >= 10
 
+    def test_default_configs_are_independent(self):
+        """Test that mutating one default config does not leak into the next."""
+        config = create_default_service_container_config()
+        config.async_adapter_pool_size = 5
+        config.session_manager["storage_directory"] = "/tmp/sessions"
+
+        fresh = create_default_service_container_config()
+
+        assert fresh.async_adapter_pool_size == 20
+        assert fresh.session_manager["storage_directory"] == "~/.tab/sessions"
+
 
 class TestConfigurationIntegration:
     """Test integration between different configuration models."""
@@ -344,4 +355,12 @@ class TestConfigurationIntegration:
 
         # Should be able to recreate from dict
         recreated_config = ServiceContainerConfig(**config_dict)
-        assert recreated_config.async_adapter_pool_size == config.async_adapter_pool_size
\ No newline at end of file
+        assert recreated_config.async_adapter_pool_size == config.async_adapter_pool_size
+
+    def test_config_json_roundtrip(self):
+        """Test that configurations roundtrip through JSON without a dict intermediate."""
+        config = create_default_service_container_config()
+
+        recreated_config = ServiceContainerConfig.model_validate_json(config.model_dump_json())
+
+        assert recreated_config == config
@@ -6,50 +6,96 @@ and prevent regressions in the dependency injection pattern.
 
 import pytest
 import asyncio
-from unittest.mock import Mock, AsyncMock
-from typing import Dict, Any
+import inspect
+from types import MappingProxyType
+from typing import final
 
+from pydantic import ValidationError
+
+from src.tab.models.conversation_session import ConversationSession
 from src.tab.services.interfaces.session_service import IConversationSessionService
 from src.tab.services.interfaces.policy_validator import IPolicyValidator
 from src.tab.services.interfaces.service_lifecycle import IServiceLifecycle
 
+# All tests are independent, so they share one event loop instead of
+# setting up and tearing down a loop per test
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+
+_INTERFACE_METHODS = {
+    IConversationSessionService: ('create_session', 'get_session', 'add_turn_to_session', 'get_session_context'),
+    IPolicyValidator: ('validate_session_creation', 'validate_turn_addition'),
+    IServiceLifecycle: ('initialize', 'start', 'stop', 'health_check'),
+}
+
+# Introspected once at import rather than on every test run
+_ASYNC_METHODS = {
+    (interface, method_name): inspect.iscoroutinefunction(getattr(interface, method_name))
+    for interface, method_names in _INTERFACE_METHODS.items()
+    for method_name in method_names
+}
+
+
+# Arguments for the concurrent operations test, formatted once at import;
+# ConversationSession copies the participant lists it is given
+_CONCURRENT_SESSION_ARGS = tuple(
+    (f"topic_{i}", [f"agent1_{i}", f"agent2_{i}"]) for i in range(5)
+)
+_CONCURRENT_VALIDATION_PARAMS = tuple({"topic": f"test_{i}"} for i in range(3))
 
+# Canned validator results shared by every call, read-only so no caller can mutate them for the next
+_ALLOWED_RESULT = MappingProxyType({"allowed": True, "violations": ()})
+_DENIED_RESULT = MappingProxyType({"allowed": False, "violations": ("policy violation",)})
+
+# Test doubles here are plain subclasses of the interfaces; unittest.mock
+# objects are far slower to build and would not check the interface shape.
+
+
+@final
 class MockSessionService(IConversationSessionService):
     """Mock implementation of session service for testing."""
 
+    # Context for the known session, shared by all instances; callers treat it as read-only.
+    # Kept as a list of dicts to match the interface's List[Dict[str, Any]] return type.
+    _VALID_CONTEXT = [{"role": "assistant", "content": "test", "from_agent": "agent1"}]
+
+    def __init__(self):
+        # The known session never changes, so build it once
+        self._valid_session = ConversationSession(participants=["agent1", "agent2"], topic="test")
+
     async def create_session(self, topic: str, participants: list, policy_id: str = "default", max_turns: int = 8, **kwargs):
-        from src.tab.models.conversation_session import ConversationSession
         return ConversationSession(participants=participants, topic=topic)
 
     async def get_session(self, session_id: str):
-        if session_id == "valid-session":
-            from src.tab.models.conversation_session import ConversationSession
-            return ConversationSession(participants=["agent1", "agent2"], topic="test")
-        return None
+        return self._valid_session if session_id == "valid-session" else None
 
     async def add_turn_to_session(self, session_id: str, turn):
         return session_id == "valid-session"
 
     async def get_session_context(self, session_id: str, agent_filter: str = None, limit: int = 5):
-        if session_id == "valid-session":
-            return [{"role": "assistant", "content": "test", "from_agent": "agent1"}]
-        return []
+        return self._VALID_CONTEXT if session_id == "valid-session" else []
 
 
+@final
 class MockPolicyValidator(IPolicyValidator):
     """Mock implementation of policy validator for testing."""
 
-    async def validate_session_creation(self, policy_id: str, session_params: Dict[str, Any]):
-        return {"allowed": policy_id != "strict", "violations": [] if policy_id != "strict" else ["policy violation"]}
+    async def validate_session_creation(self, policy_id: str, session_params: dict):
+        return _DENIED_RESULT if policy_id == "strict" else _ALLOWED_RESULT
 
     async def validate_turn_addition(self, policy_id: str, session, turn):
         return {"allowed": True, "violations": []}
 
 
+@final
 class MockServiceLifecycle(IServiceLifecycle):
     """Mock implementation of service lifecycle for testing."""
 
     def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Return the mock to its freshly constructed state."""
         self.initialized = False
         self.started = False
         self.stopped = False
@@ -69,106 +115,116 @@ class MockServiceLifecycle(IServiceLifecycle):
         return {"healthy": self.started and not self.stopped, "initialized": self.initialized}
 
 
-class TestServiceInterfaces:
-    """Test service interface implementations."""
+# The mocks are cheap to share: only the lifecycle mock holds state, and the
+# ``lifecycle`` fixture resets it after every test.
+@pytest.fixture(scope="module")
+def session_service():
+    return MockSessionService()
 
-    @pytest.mark.asyncio
-    async def test_session_service_interface_compliance(self):
-        """Test that session service interface works correctly."""
-        service = MockSessionService()
-
-        # Test session creation
-        session = await service.create_session(
-            topic="Test session",
-            participants=["agent1", "agent2"],
-            max_turns=10
-        )
-        assert session is not None
-        assert session.topic == "Test session"
-        assert len(session.participants) == 2
-
-        # Test session retrieval
-        found_session = await service.get_session("valid-session")
-        assert found_session is not None
-
-        not_found = await service.get_session("invalid-session")
-        assert not_found is None
-
-        # Test context retrieval
-        context = await service.get_session_context("valid-session", limit=5)
-        assert isinstance(context, list)
-        assert len(context) >= 0
-
-    @pytest.mark.asyncio
-    async def test_policy_validator_interface_compliance(self):
-        """Test that policy validator interface works correctly."""
-        validator = MockPolicyValidator()
-
-        # Test session validation
-        result = await validator.validate_session_creation("default", {
-            "topic": "test",
-            "participants": ["agent1", "agent2"]
-        })
-        assert isinstance(result, dict)
-        assert "allowed" in result
-        assert result["allowed"] is True
-
-        # Test strict policy
-        strict_result = await validator.validate_session_creation("strict", {})
-        assert strict_result["allowed"] is False
-        assert len(strict_result["violations"]) > 0
-
-        # Test turn validation
-        from src.tab.models.conversation_session import ConversationSession
-        session = ConversationSession(participants=["agent1", "agent2"], topic="test")
-
-        from src.tab.models.turn_message import TurnMessage, MessageRole
-        turn = TurnMessage(
-            session_id=session.session_id,
-            from_agent="agent1",
-            to_agent="agent2",
-            role=MessageRole.ASSISTANT,
-            content="test message"
-        )
-
-        turn_result = await validator.validate_turn_addition("default", session, turn)
-        assert isinstance(turn_result, dict)
-        assert "allowed" in turn_result
-
-    @pytest.mark.asyncio
-    async def test_service_lifecycle_interface_compliance(self):
-        """Test that service lifecycle interface works correctly."""
-        service = MockServiceLifecycle()
-
-        # Test initialization
-        assert not service.initialized
-        await service.initialize()
-        assert service.initialized
 
-        # Test startup
-        assert not service.started
-        await service.start()
-        assert service.started
+@pytest.fixture(scope="module")
+def policy_validator():
+    return MockPolicyValidator()
+
+
+@pytest.fixture(scope="module")
+def _shared_lifecycle():
+    return MockServiceLifecycle()
+
+
+@pytest.fixture
+def lifecycle(_shared_lifecycle):
+    yield _shared_lifecycle
+    _shared_lifecycle.reset()
 
-        # Test health check
-        health = await service.health_check()
-        assert isinstance(health, dict)
-        assert health["healthy"] is True
-        assert health["initialized"] is True
 
-        # Test stop
-        assert not service.stopped
-        await service.stop()
-        assert service.stopped
+async def _session_service_scenario(service, _session, _turn):
+    """Exercise the session service interface."""
+    # Test session creation
+    session = await service.create_session(
+        topic="Test session",
+        participants=["agent1", "agent2"],
+        max_turns=10
+    )
+    assert session is not None
+    assert session.topic == "Test session"
+    assert len(session.participants) == 2
 
-        # Health check after stop
-        health_stopped = await service.health_check()
-        assert health_stopped["healthy"] is False
+    # Test session retrieval
+    found_session = await service.get_session("valid-session")
+    assert found_session is not None
 
-    @pytest.mark.asyncio
-    async def test_service_lifecycle_error_handling(self):
+    not_found = await service.get_session("invalid-session")
+    assert not_found is None
+
+    # Test context retrieval
+    context = await service.get_session_context("valid-session", limit=5)
+    assert isinstance(context, list)
+
+
+async def _policy_validator_scenario(validator, session, turn):
+    """Exercise the policy validator interface."""
+    # Test session validation
+    result = await validator.validate_session_creation("default", {
+        "topic": "test",
+        "participants": ["agent1", "agent2"]
+    })
+    assert "allowed" in result
+    assert result["allowed"] is True
+
+    # Test strict policy
+    strict_result = await validator.validate_session_creation("strict", {})
+    assert strict_result["allowed"] is False
+    assert len(strict_result["violations"]) > 0
+
+    # Test turn validation
+    turn_result = await validator.validate_turn_addition("default", session, turn)
+    assert "allowed" in turn_result
+
+
+async def _service_lifecycle_scenario(service, _session, _turn):
+    """Exercise the service lifecycle interface."""
+    # Test initialization
+    assert not service.initialized
+    await service.initialize()
+    assert service.initialized
+
+    # Test startup
+    assert not service.started
+    await service.start()
+    assert service.started
+
+    # Test health check
+    health = await service.health_check()
+    assert isinstance(health, dict)
+    assert health["healthy"] is True
+    assert health["initialized"] is True
+
+    # Test stop
+    assert not service.stopped
+    await service.stop()
+    assert service.stopped
+
+    # Health check after stop
+    health_stopped = await service.health_check()
+    assert health_stopped["healthy"] is False
+
+
+class TestServiceInterfaces:
+    """Test service interface implementations."""
+
+    @pytest.mark.parametrize("service_fixture,scenario", [
+        ("session_service", _session_service_scenario),
+        ("policy_validator", _policy_validator_scenario),
+        ("lifecycle", _service_lifecycle_scenario),
+    ], ids=["session_service", "policy_validator", "service_lifecycle"])
+    async def test_interface_compliance(self, request, service_fixture, scenario, valid_session, valid_turn):
+        """Test that each interface implementation works correctly."""
+        await scenario(request.getfixturevalue(service_fixture), valid_session, valid_turn)
+
+    async def test_service_lifecycle_error_handling(self, lifecycle):
         """Test error handling in service lifecycle."""
-        service = MockServiceLifecycle()
+        service = lifecycle
 
         # Starting without initialization should fail
         with pytest.raises(RuntimeError, match="Service not initialized"):
@@ -179,66 +235,54 @@ class TestServiceInterfaces:
         await service.start()
         assert service.started
 
-    @pytest.mark.asyncio
-    async def test_interface_parameter_validation(self):
+    async def test_interface_parameter_validation(self, session_service):
         """Test that interface parameters are properly validated."""
-        service = MockSessionService()
+        service = session_service
 
         # Test with invalid parameters (should be caught by pydantic validation)
-        with pytest.raises(Exception):  # Pydantic validation error
+        with pytest.raises(ValidationError):
             await service.create_session(
                 topic="",  # Empty topic should fail
                 participants=["agent1", "agent2"]
             )
 
-        with pytest.raises(Exception):  # Pydantic validation error
+        with pytest.raises(ValidationError):
             await service.create_session(
                 topic="valid topic",
                 participants=["single"]  # Need at least 2 participants
             )
 
-    @pytest.mark.asyncio
     async def test_async_interface_compliance(self):
         """Test that all interface methods are properly async."""
-        import inspect
-
-        # Check IConversationSessionService methods
-        for method_name in ['create_session', 'get_session', 'add_turn_to_session', 'get_session_context']:
-            method = getattr(IConversationSessionService, method_name)
-            assert inspect.iscoroutinefunction(method), f"{method_name} should be async"
-
-        # Check IPolicyValidator methods
-        for method_name in ['validate_session_creation', 'validate_turn_addition']:
-            method = getattr(IPolicyValidator, method_name)
-            assert inspect.iscoroutinefunction(method), f"{method_name} should be async"
-
-        # Check IServiceLifecycle methods
-        for method_name in ['initialize', 'start', 'stop', 'health_check']:
-            method = getattr(IServiceLifecycle, method_name)
-            assert inspect.iscoroutinefunction(method), f"{method_name} should be async"
+        not_async = [
+            f"{interface.__name__}.{method_name}"
+            for (interface, method_name), is_async in _ASYNC_METHODS.items()
+            if not is_async
+        ]
+        assert not not_async, f"Interface methods should be async: {not_async}"
 
-    @pytest.mark.asyncio
-    async def test_concurrent_interface_operations(self):
+    @pytest.mark.stress
+    async def test_concurrent_interface_operations(self, session_service, policy_validator):
         """Test that interface implementations handle concurrent operations."""
-        service = MockSessionService()
-        validator = MockPolicyValidator()
+        service = session_service
+        validator = policy_validator
 
         # Run multiple operations concurrently
         tasks = [
-            service.create_session(f"topic_{i}", [f"agent1_{i}", f"agent2_{i}"])
-            for i in range(5)
+            service.create_session(topic, participants)
+            for topic, participants in _CONCURRENT_SESSION_ARGS
         ]
 
         sessions = await asyncio.gather(*tasks)
-        assert len(sessions) == 5
+        assert len(sessions) == len(_CONCURRENT_SESSION_ARGS)
         assert all(session is not None for session in sessions)
 
         # Concurrent validation operations
         validation_tasks = [
-            validator.validate_session_creation("default", {"topic": f"test_{i}"})
-            for i in range(3)
+            validator.validate_session_creation("default", params)
+            for params in _CONCURRENT_VALIDATION_PARAMS
         ]
 
         results = await asyncio.gather(*validation_tasks)
-        assert len(results) == 3
+        assert len(results) == len(_CONCURRENT_VALIDATION_PARAMS)
         assert all(result["allowed"] for result in results)
\ No newline at end of file
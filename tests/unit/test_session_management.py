@@ -10,12 +10,14 @@ from unittest.mock import Mock, AsyncMock, patch, mock_open
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, Any, List
+import asyncio
 import json
 import tempfile
+import threading
 import os
 
 from tab.services.session_manager import SessionManager
-from tab.models.conversation_session import ConversationSession
+from tab.models.conversation_session import ConversationSession, SessionStatus
 from tab.models.turn_message import TurnMessage
 from tab.models.orchestration_state import OrchestrationState
 
@@ -650,4 +652,253 @@ class TestSessionCleanup:
         session = await session_manager.get_session(created_session.session_id)
 
         # Should have some mechanism to handle large sessions
-        assert len(session.turn_history) <= session_manager.config.get("max_turns_per_session", 1000)
\ No newline at end of file
+        assert len(session.turn_history) <= session_manager.config.get("max_turns_per_session", 1000)
+
+
+@pytest.fixture
+def storage_manager(temp_session_dir):
+    """SessionManager persisting into a temporary storage directory."""
+    return SessionManager({"storage_directory": temp_session_dir, "auto_cleanup_enabled": False})
+
+
+def _add_turn(session, content):
+    """Append a valid turn to ``session``."""
+    turn = TurnMessage(
+        session_id=session.session_id,
+        from_agent="claude_code",
+        to_agent="codex_cli",
+        role="assistant",
+        content=content
+    )
+    assert session.add_turn_message(turn)
+
+
+class TestSessionLogStorage:
+    """Test the append-only JSONL session log."""
+
+    @pytest.mark.asyncio
+    async def test_update_appends_only_new_turns(self, storage_manager, temp_session_dir):
+        """Test that each update appends new turns and a session record."""
+        session = await storage_manager.create_session(topic="Log test", participants=["claude_code", "codex_cli"])
+        log_file = Path(temp_session_dir) / f"{session.session_id}.jsonl"
+
+        _add_turn(session, "first")
+        await storage_manager.update_session(session.session_id, session)
+        _add_turn(session, "second")
+        await storage_manager.update_session(session.session_id, session)
+
+        records = [json.loads(line) for line in log_file.read_text().splitlines()]
+        assert [record["type"] for record in records] == ["session", "turn", "session_update", "turn", "session_update"]
+        assert [record["turn"]["content"] for record in records if record["type"] == "turn"] == ["first", "second"]
+        assert "turn_history" not in records[0]["session"]
+
+    @pytest.mark.asyncio
+    async def test_update_writes_only_changed_fields(self, storage_manager, temp_session_dir):
+        """Test that an update records just the fields that changed."""
+        session = await storage_manager.create_session(topic="Log test", participants=["claude_code", "codex_cli"])
+        log_file = Path(temp_session_dir) / f"{session.session_id}.jsonl"
+
+        session.transition_to(SessionStatus.COMPLETED)
+        await storage_manager.update_session(session.session_id, session)
+        await storage_manager.update_session(session.session_id, session)
+
+        records = [json.loads(line) for line in log_file.read_text().splitlines()]
+        assert len(records) == 2
+        assert set(records[1]["session"]) == {"status", "updated_at"}
+        assert "orchestration_state" not in records[1]
+
+        reloaded = await SessionManager({"storage_directory": temp_session_dir}).get_session(session.session_id)
+        assert reloaded.status == SessionStatus.COMPLETED
+        assert reloaded.updated_at == session.updated_at
+
+    @pytest.mark.asyncio
+    async def test_log_round_trip(self, storage_manager, temp_session_dir):
+        """Test that a fresh manager rebuilds the session from its log."""
+        session = await storage_manager.create_session(topic="Log test", participants=["claude_code", "codex_cli"])
+        _add_turn(session, "first")
+        session.metadata["note"] = "kept"
+        await storage_manager.update_session(session.session_id, session)
+
+        reloaded = await SessionManager({"storage_directory": temp_session_dir}).get_session(session.session_id)
+
+        assert reloaded.current_turn == 1
+        assert reloaded.metadata == {"note": "kept"}
+        assert [turn["content"] for turn in reloaded.turn_history] == ["first"]
+
+    @pytest.mark.asyncio
+    async def test_truncated_record_is_skipped(self, storage_manager, temp_session_dir):
+        """Test that a partially written final record does not lose the session."""
+        session = await storage_manager.create_session(topic="Log test", participants=["claude_code", "codex_cli"])
+        log_file = Path(temp_session_dir) / f"{session.session_id}.jsonl"
+        with open(log_file, 'a') as f:
+            f.write('{"type": "turn", "tu')
+
+        reloaded = await SessionManager({"storage_directory": temp_session_dir}).get_session(session.session_id)
+
+        assert reloaded.topic == "Log test"
+        assert reloaded.turn_history == []
+
+    @pytest.mark.asyncio
+    async def test_legacy_snapshot_is_migrated(self, storage_manager, temp_session_dir):
+        """Test that legacy .json snapshots load and are replaced by a log on save."""
+        session = ConversationSession(topic="Legacy", participants=["claude_code", "codex_cli"])
+        legacy_file = Path(temp_session_dir) / f"{session.session_id}.json"
+        legacy_file.write_text(json.dumps({"session": session.model_dump(mode="json"), "orchestration_state": None}))
+
+        loaded = await storage_manager.get_session(session.session_id)
+        assert loaded.topic == "Legacy"
+
+        await storage_manager.update_session(session.session_id, loaded)
+        assert not legacy_file.exists()
+        assert (Path(temp_session_dir) / f"{session.session_id}.jsonl").exists()
+        assert [summary["topic"] for summary in await storage_manager.list_sessions()] == ["Legacy"]
+
+    @pytest.mark.asyncio
+    async def test_shutdown_compacts_log(self, storage_manager, temp_session_dir):
+        """Test that shutdown rewrites each log with a single session record."""
+        session = await storage_manager.create_session(topic="Log test", participants=["claude_code", "codex_cli"])
+        _add_turn(session, "first")
+        await storage_manager.update_session(session.session_id, session)
+
+        await storage_manager.shutdown()
+
+        log_file = Path(temp_session_dir) / f"{session.session_id}.jsonl"
+        records = [json.loads(line) for line in log_file.read_text().splitlines()]
+        assert [record["type"] for record in records] == ["turn", "session"]
+
+    @pytest.mark.asyncio
+    async def test_interrupted_compaction_keeps_log(self, storage_manager, temp_session_dir):
+        """Test that a rewrite failing before it replaces the log leaves the log intact."""
+        session = await storage_manager.create_session(topic="Log test", participants=["claude_code", "codex_cli"])
+        _add_turn(session, "first")
+        await storage_manager.update_session(session.session_id, session)
+
+        log_file = Path(temp_session_dir) / f"{session.session_id}.jsonl"
+        previous_log = log_file.read_bytes()
+
+        with patch("os.fsync", side_effect=OSError("disk full")):
+            await storage_manager.shutdown()
+
+        assert log_file.read_bytes() == previous_log
+        assert (await SessionManager({"storage_directory": temp_session_dir}).get_session(session.session_id)).turn_history
+
+    @pytest.mark.asyncio
+    async def test_load_during_update_keeps_newer_bookkeeping(self, storage_manager, temp_session_dir):
+        """Test that a log read overlapping a save does not make later saves repeat turns."""
+        session = ConversationSession(topic="Legacy", participants=["claude_code", "codex_cli"])
+        legacy_file = Path(temp_session_dir) / f"{session.session_id}.json"
+        legacy_file.write_text(json.dumps({"session": session.model_dump(mode="json"), "orchestration_state": None}))
+
+        loaded = await storage_manager.get_session(session.session_id)
+        _add_turn(loaded, "one")
+        await storage_manager.update_session(session.session_id, loaded)
+
+        fold_log_file = SessionManager._fold_log_file
+        log_read, save_done = threading.Event(), threading.Event()
+
+        def slow_fold(manager, log_file):
+            folded = fold_log_file(manager, log_file)
+            log_read.set()
+            save_done.wait(5)
+            return folded
+
+        with patch.object(SessionManager, "_fold_log_file", slow_fold):
+            # No orchestration state is cached, so this reads the log
+            load = asyncio.create_task(storage_manager.get_orchestration_state(session.session_id))
+            await asyncio.to_thread(log_read.wait, 5)
+            _add_turn(loaded, "two")
+            await storage_manager.update_session(session.session_id, loaded)
+            save_done.set()
+            await load
+
+        await storage_manager.update_session(session.session_id, loaded)
+
+        reloaded = await SessionManager({"storage_directory": temp_session_dir}).get_session(session.session_id)
+        assert [turn["content"] for turn in reloaded.turn_history] == ["one", "two"]
+
+
+class TestInMemorySessionStore:
+    """Test that reads are served from the in-memory cache."""
+
+    @pytest.mark.asyncio
+    async def test_list_sessions_newest_first(self, storage_manager):
+        """Test that sessions are listed newest first."""
+        await storage_manager.create_session(topic="Older", participants=["claude_code", "codex_cli"])
+        await storage_manager.create_session(topic="Newer", participants=["claude_code", "codex_cli"])
+
+        summaries = await storage_manager.list_sessions()
+
+        assert [summary["topic"] for summary in summaries] == ["Newer", "Older"]
+
+    @pytest.mark.asyncio
+    async def test_storage_sessions_are_cached_with_state(self, storage_manager, temp_session_dir):
+        """Test that listing loads a stored session and its state into memory once."""
+        session = await storage_manager.create_session(topic="Stored", participants=["claude_code", "codex_cli"])
+        manager = SessionManager({"storage_directory": temp_session_dir})
+
+        assert len(await manager.list_sessions()) == 1
+        (Path(temp_session_dir) / f"{session.session_id}.jsonl").unlink()
+
+        assert (await manager.get_session(session.session_id)).topic == "Stored"
+        assert (await manager.get_orchestration_state(session.session_id)).active_agent == "claude_code"
+
+    @pytest.mark.asyncio
+    async def test_storage_not_rescanned_after_initialize(self, storage_manager, temp_session_dir):
+        """Test that memory is authoritative once storage has been loaded."""
+        await storage_manager.initialize()
+
+        other_manager = SessionManager({"storage_directory": temp_session_dir, "auto_cleanup_enabled": False})
+        await other_manager.create_session(topic="Elsewhere", participants=["claude_code", "codex_cli"])
+
+        assert await storage_manager.get_active_sessions() == []
+        assert await storage_manager.list_sessions() == []
+
+    @pytest.mark.asyncio
+    async def test_initialize_recovers_all_sessions(self, storage_manager, temp_session_dir):
+        """Test that startup recovery loads every stored session."""
+        created = [
+            await storage_manager.create_session(topic=f"Session {i}", participants=["claude_code", "codex_cli"])
+            for i in range(5)
+        ]
+        (Path(temp_session_dir) / "unreadable.jsonl").write_text("not json\n")
+
+        manager = SessionManager({"storage_directory": temp_session_dir, "auto_cleanup_enabled": False})
+        await manager.initialize()
+        for session in created:
+            (Path(temp_session_dir) / f"{session.session_id}.jsonl").unlink()
+
+        summaries = await manager.list_sessions()
+        assert sorted(summary["topic"] for summary in summaries) == [session.topic for session in created]
+        for session in created:
+            assert await manager.get_orchestration_state(session.session_id) is not None
+
+    @pytest.mark.asyncio
+    async def test_list_sessions_by_status(self, storage_manager):
+        """Test status filtering, including sessions transitioned in place."""
+        active = await storage_manager.create_session(topic="Active", participants=["claude_code", "codex_cli"])
+        saved = await storage_manager.create_session(topic="Saved", participants=["claude_code", "codex_cli"])
+        unsaved = await storage_manager.create_session(topic="Unsaved", participants=["claude_code", "codex_cli"])
+        deleted = await storage_manager.create_session(topic="Deleted", participants=["claude_code", "codex_cli"])
+
+        saved.transition_to(SessionStatus.COMPLETED)
+        await storage_manager.update_session(saved.session_id, saved)
+        unsaved.transition_to(SessionStatus.COMPLETED)
+        await storage_manager.delete_session(deleted.session_id)
+
+        completed = await storage_manager.list_sessions(status=SessionStatus.COMPLETED)
+        assert sorted(summary["topic"] for summary in completed) == ["Saved", "Unsaved"]
+        assert await storage_manager.get_active_sessions() == [active]
+        assert await storage_manager.list_sessions(status=SessionStatus.FAILED) == []
+
+    @pytest.mark.asyncio
+    async def test_list_sessions_by_status_after_direct_assignment(self, storage_manager):
+        """Test that a terminal session reassigned in place is listed under its new status."""
+        session = await storage_manager.create_session(topic="Reassigned", participants=["claude_code", "codex_cli"])
+        session.transition_to(SessionStatus.COMPLETED)
+        await storage_manager.update_session(session.session_id, session)
+
+        session.status = SessionStatus.FAILED
+
+        failed = await storage_manager.list_sessions(status=SessionStatus.FAILED)
+        assert [summary["topic"] for summary in failed] == ["Reassigned"]
+        assert await storage_manager.list_sessions(status=SessionStatus.COMPLETED) == []